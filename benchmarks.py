@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# python benchmarks.py --repeat 200 --json
+#
+# Сцена игры и окно не создаются, но пакет robogame_engine при любом импорте
+# (geometry, theme) загружает pygame, а DontsovDrone наследуется от Drone из astrobox,
+# поэтому pygame должен быть установлен. Дисплей и звук не нужны: SDL переключается
+# на драйверы-заглушки, приветствие pygame не печатается и не портит вывод JSON.
+
+import argparse
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from hangar_2021.dontsov_a_v_package.attack_action import AttackBaseAction  # noqa: E402
+from hangar_2021.dontsov_a_v_package.move_actions import MoveToSector  # noqa: E402
+from hangar_2021.dontsov_a_v_package.stand_in import make_scene  # noqa: E402
+
+SCENE_SIZES = [
+    {'drones_per_team': 5, 'asteroids_count': 10},
+    {'drones_per_team': 10, 'asteroids_count': 30},
+    {'drones_per_team': 20, 'asteroids_count': 60},
+    {'drones_per_team': 40, 'asteroids_count': 120},
+]
+
+
+def measure(world, func, repeat):
+    """
+    Среднее время вызова функции в микросекундах, перед каждым вызовом начинается новый шаг игры.
+
+    :param world: StandInWorld
+    :param func: функция без аргументов
+    :param repeat: int
+    :return: float
+    """
+    total = 0
+    for _ in range(repeat):
+        world.step()
+        start = time.perf_counter()
+        func()
+        total += time.perf_counter() - start
+    return total / repeat * 10 ** 6
+
+
+def get_cases(world):
+    """
+    Замеряемые функции CommandCenter и действий на сцене.
+
+    :param world: StandInWorld
+    :return: Dict
+    """
+    nav = world.command_center
+    drone = next(drone for drone in world.team_drones if drone.is_alive)
+    enemy_sector = next(
+        sector for sector in nav.sectors
+        if sector.mothership and not sector.home_sector and not sector.front
+    )
+    attack_action = AttackBaseAction(drone=drone, sector=enemy_sector, base_attack=True)
+    squad_attack = [
+        AttackBaseAction(drone=mate, sector=enemy_sector, base_attack=True)
+        for mate in world.team_drones if mate.is_alive
+    ]
+    move_to_sector = MoveToSector(drone=drone, sector=enemy_sector)
+    point = world.random_point(margin=0)
+    return {
+        'get_game_data': nav.get_game_data,
+        'get_next_strategy': nav.get_next_strategy,
+        'get_objects_with_loot': nav.get_objects_with_loot,
+        'is_obj_safe': lambda: nav.is_obj_safe(obj=point),
+        'next_target_attack': attack_action.next_target_attack,
+        'next_target_attack_squad': lambda: [action.next_target_attack() for action in squad_attack],
+        'get_start_position': move_to_sector.get_start_position,
+    }
+
+
+def run(repeat, seed):
+    """
+    Замер всех функций на сценах разного размера.
+
+    :param repeat: int
+    :param seed: int
+    :return: List
+    """
+    results = []
+    for size in SCENE_SIZES:
+        world = make_scene(seed=seed, **size)
+        for name, func in get_cases(world).items():
+            results.append(dict(size, case=name, microseconds=measure(world=world, func=func, repeat=repeat)))
+    return results
+
+
+def print_table(results):
+    print('{:>8} {:>10} {:<24} {:>12}'.format('drones', 'asteroids', 'case', 'us per call'))
+    for result in results:
+        print('{:>8} {:>10} {:<24} {:>12.1f}'.format(
+            result['drones_per_team'], result['asteroids_count'], result['case'], result['microseconds']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Микро-бенчмарки CommandCenter на синтетических сценах.')
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='вывод результата в формате JSON')
+    args = parser.parse_args(argv)
+    results = run(repeat=args.repeat, seed=args.seed)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_table(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,25 +6,33 @@ from astrobox.core import Drone, GameObject
 from robogame_engine.geometry import Point, Vector
 
 from hangar_2021.dontsov_a_v_package import HEALING_DISTANCE, FIELD_HEIGHT, FIELD_WIDTH, RADIUS_ATTACK, \
-    DefenderStrategy, SabotageStrategy, HarvestStrategy, LastBattleStrategy
+    DefenderStrategy, SabotageStrategy, HarvestStrategy, LastBattleStrategy, WorldSnapshot, get_game_tick, \
+    TeamStatsStore, SpatialGrid, ENEMY_DRONES, ThreatRaster, SectorGeometry, Sector, EventEngine, EventRule, \
+    SquadPlanner, HarvestAssignment, StrategyPool, FireControl, FireAllocation, Formation, PathPlanner, \
+    KinematicTracker, LootIndex, \
+    CommandCenterRegistry
 
 
 class DontsovDrone(Drone):
     """
     Дочерний класс Drone
     """
-    command_center = None
+    command_centers = CommandCenterRegistry()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.command_center = None
         self.strategy = None
         self.target_attack = None
         self.start_position = None
         self.target_move = None
 
     def on_born(self):
-        if DontsovDrone.command_center is None:
-            DontsovDrone.command_center = CommandCenter(my_mothership=self.my_mothership, space_field=self.scene)
+        self.command_center = self.command_centers.get(
+            scene=self.scene,
+            team=self.team,
+            create=lambda: CommandCenter(my_mothership=self.my_mothership, space_field=self.scene),
+        )
         self.command_center.run(drone=self)
         self.next_action()
 
@@ -35,18 +43,21 @@ class DontsovDrone(Drone):
         self.next_action()
 
     def on_load_complete(self):
+        self.command_center.on_load_complete(drone=self)
         self.next_action()
 
     def on_stop_at_mothership(self, mothership):
         self.next_action()
 
     def on_unload_complete(self):
+        self.command_center.on_unload_complete(drone=self)
         self.next_action()
 
     def on_wake_up(self):
         self.strategy.action()
 
     def on_heartbeat(self):
+        self.command_center.on_heartbeat()
         self.next_action()
 
     def next_action(self):
@@ -61,34 +72,149 @@ class CommandCenter:
     def __init__(self, my_mothership, space_field):
         self.space_field = space_field
         self.my_mothership = my_mothership
+        self.team_name = my_mothership.team
         self.init_strategy = HarvestStrategy
         self.sectors = None
+        self.sector_geometry = None
         self.total_ellirium = 0
-        self.events = [
-            self.harvest_in_begin_event,
-            self.harvest_in_alien_sector_event,
-            self.home_under_threat_event,
-            self.attack_sector_without_soldiers_event,
-            self.attack_sector_without_base_event,
-            self.attack_sector_without_defenders_event,
-            self.knight_move_event,
-            self.safe_harvest_event,
-            self.attack_near_sector_with_risk_event,
-        ]
+        self._snapshot = None
+        self._objects_count = None
+        self._alive_objects = []
+        self._heartbeat_tick = None
+        self.team_stats = TeamStatsStore()
+        self.spatial_index = SpatialGrid()
+        self.threat_raster = ThreatRaster()
+        self.kinematics = KinematicTracker()
+        self.loot_index = LootIndex(command_center=self)
+        self.events = EventEngine(
+            rules=[
+                EventRule(event=self.harvest_in_begin_event, inputs=('start_game',)),
+                EventRule(event=self.harvest_in_alien_sector_event, inputs=('loot_sectors', 'soldiers')),
+                EventRule(event=self.home_under_threat_event, inputs=('home_threat',)),
+                EventRule(event=self.attack_sector_without_soldiers_event, inputs=('soldiers', 'motherships')),
+                EventRule(event=self.attack_sector_without_base_event, inputs=('defenders', 'motherships')),
+                EventRule(event=self.attack_sector_without_defenders_event, inputs=('defenders', 'motherships')),
+                EventRule(event=self.knight_move_event, inputs=('soldiers', 'defenders', 'motherships', 'risk')),
+                EventRule(event=self.safe_harvest_event, inputs=('safe_loot',)),
+                EventRule(
+                    event=self.attack_near_sector_with_risk_event,
+                    inputs=('defenders', 'motherships', 'teammates', 'risk')
+                ),
+            ],
+            inputs=self.get_event_inputs(),
+            default=(DefenderStrategy, {}),
+        )
+        self.planner = SquadPlanner(command_center=self)
+        self.harvest_assignment = HarvestAssignment(command_center=self)
+        self.fire_control = FireControl(command_center=self)
+        self.fire_allocation = FireAllocation(command_center=self)
+        self.formation = Formation(command_center=self)
+        self.path_planner = PathPlanner(command_center=self)
+        self.strategy_pools = {}
 
     def run(self, drone):
         """
         Уставновление стартовой стратегии.
         """
         self.start_navigation()
-        drone.strategy = self.init_strategy(drone=drone)
+        drone.strategy = self.get_strategy_pool(drone=drone).get(self.init_strategy)
         self.total_ellirium = sum([asteroid.payload for asteroid in self.space_field.asteroids])
 
     def start_navigation(self):
         """
         Запуск навигации
         """
-        self.sectors = self.get_sorted_sectors()
+        if self.sector_geometry is None:
+            self.sector_geometry = SectorGeometry()
+            self.sectors = self.get_sorted_sectors()
+
+    @property
+    def snapshot(self):
+        """
+        Срез состояния мира на текущий шаг игры, пересоздается при смене шага.
+
+        При смене шага положения вражеских дронов записываются в слежение
+        и ищутся погибшие с прошлого шага дроны и базы.
+
+        :return: WorldSnapshot
+        """
+        tick = get_game_tick(self.space_field)
+        if self._snapshot is None or not self._snapshot.is_actual(tick):
+            self._snapshot = WorldSnapshot(command_center=self, tick=tick)
+            self.kinematics.update(tick=tick, drones=self._snapshot.enemy_drones_alive)
+            self.detect_deaths(drones=self._snapshot.drones)
+        return self._snapshot
+
+    def detect_deaths(self, drones):
+        """
+        Вызов обработчика гибели для дронов и баз, погибших с прошлой проверки.
+
+        Движок не сообщает о гибели чужих объектов, поэтому проверяются только объекты,
+        живые при прошлой проверке. При появлении на поле новых объектов список живых
+        собирается заново без вызова обработчиков, а все объекты учитываются в статистике команд.
+
+        :param drones: Список всех дронов на поле
+        """
+        motherships = self.space_field.motherships
+        objects_count = len(drones) + len(motherships)
+        if objects_count != self._objects_count:
+            self._objects_count = objects_count
+            self._alive_objects = [obj for obj in drones + list(motherships) if obj.is_alive]
+            self.team_stats.register(drones=drones, motherships=motherships)
+            return
+        alive_objects = []
+        for obj in self._alive_objects:
+            if obj.is_alive:
+                alive_objects.append(obj)
+            else:
+                self.on_death(obj)
+        self._alive_objects = alive_objects
+
+    def on_death(self, obj):
+        """
+        Обработчик гибели дрона или базы.
+
+        :param obj: Drone or MotherShip
+        """
+        self.loot_index.update(obj)
+        self.team_stats.update(obj)
+
+    def on_load_complete(self, drone):
+        """
+        Обработчик окончания загрузки дрона команды.
+
+        :param drone: DontsovDrone
+        """
+        self.loot_index.update(drone)
+        self.team_stats.update_drone(drone)
+        if drone.target_move is not None:
+            self.loot_index.update(drone.target_move)
+
+    def on_unload_complete(self, drone):
+        """
+        Обработчик окончания выгрузки дрона команды.
+
+        :param drone: DontsovDrone
+        """
+        self.loot_index.update(drone)
+        self.team_stats.update_drone(drone)
+        self.team_stats.update_mothership(drone.my_mothership)
+
+    def on_heartbeat(self):
+        """
+        Обработчик heartbeat дронов команды.
+
+        Загрузка и выгрузка дронов противников событий не вызывает, поэтому их груз
+        и элириум баз перепроверяются раз в интервал heartbeat, один раз за шаг.
+        """
+        snapshot = self.snapshot
+        if snapshot.tick is not None and snapshot.tick == self._heartbeat_tick:
+            return
+        self._heartbeat_tick = snapshot.tick
+        for drone in snapshot.enemy_drones_alive:
+            self.team_stats.update_drone(drone)
+        for mship in self.space_field.motherships:
+            self.team_stats.update_mothership(mship)
 
     def analyzing(self, drone):
         """
@@ -103,12 +229,31 @@ class CommandCenter:
 
         :return: tuple
         """
-        for event in self.events:
-            next_strategy_param = event()
-            if next_strategy_param:
-                return next_strategy_param
-        else:
-            return DefenderStrategy, {}
+        return self.planner.plan
+
+    def get_event_inputs(self):
+        """
+        Входные данные событий, по изменению которых пересчитываются их результаты.
+
+        :return: Dict
+        """
+        return {
+            'start_game': self.is_start_game,
+            'home_threat': lambda: bool(self.get_enemy_drones_in_radius(
+                point=self.my_mothership,
+                radius=RADIUS_ATTACK + self.my_mothership.radius
+            )),
+            'soldiers': lambda: tuple(team.number_soldiers for team in self.get_game_data()),
+            'defenders': lambda: tuple(team.defenders for team in self.get_game_data()),
+            'motherships': lambda: tuple(mship.is_alive for mship in self.space_field.motherships),
+            'loot_sectors': lambda: tuple(bool(loot) for loot in self.snapshot.loot_by_sector),
+            'safe_loot': lambda: (
+                self.snapshot.threat_raster.version,
+                tuple(id(obj) for obj in self.snapshot.objects_with_loot)
+            ),
+            'teammates': lambda: len(self.snapshot.team_drones_alive),
+            'risk': lambda: bool(self.is_risk_game()),
+        }
 
     def home_under_threat_event(self):
         """
@@ -116,8 +261,10 @@ class CommandCenter:
 
         :return: tuple
         """
-        enemy_drones = self.get_drones(filters=[self.get_enemy_drones, self.get_alive_obj])
-        enemy_drones_in_radius_attack = [drone for drone in enemy_drones if self.is_base_radius_attack(drone)]
+        enemy_drones_in_radius_attack = self.get_enemy_drones_in_radius(
+            point=self.my_mothership,
+            radius=RADIUS_ATTACK + self.my_mothership.radius
+        )
         if enemy_drones_in_radius_attack:
             return DefenderStrategy, {}
 
@@ -127,18 +274,17 @@ class CommandCenter:
 
         :return: tuple
         """
-        enemy_sectors = [sector for sector in self.sectors if not sector['home_sector'] and not sector['front']]
+        enemy_sectors = [sector for sector in self.sectors if not sector.home_sector and not sector.front]
         for sector in enemy_sectors:
-            game_data = self.get_game_data()
-            number_soldiers = next(
-                (team['number_soldiers'] for team in game_data if team.get('team_name') == sector['team_name']), False)
-            if sector['mothership']:
-                if not sector['mothership'].is_alive and number_soldiers == 0:
-                    front_sector = next((sector for sector in self.sectors if sector['front']), False)
-                    if front_sector['mothership'] and front_sector['mothership'].is_alive:
+            team = self.get_team_data(team_name=sector.team_name)
+            number_soldiers = team.number_soldiers if team else False
+            if sector.mothership:
+                if not sector.mothership.is_alive and number_soldiers == 0:
+                    front_sector = next((sector for sector in self.sectors if sector.front), False)
+                    if front_sector.mothership and front_sector.mothership.is_alive:
                         enemy_defenders = self.get_base_defender(
-                            team_name=front_sector['team_name'],
-                            mothership=front_sector['mothership'],
+                            team_name=front_sector.team_name,
+                            mothership=front_sector.mothership,
                         )
                         if self.is_risk_game() or len(enemy_defenders) <= 1:
                             return SabotageStrategy, {
@@ -153,20 +299,17 @@ class CommandCenter:
 
         :return: tuple
         """
-        near_sectors = [sector for sector in self.sectors if not sector['front'] and not sector['home_sector']]
+        near_sectors = [sector for sector in self.sectors if not sector.front and not sector.home_sector]
         near_motherships_alive = [
-            sector['mothership'] for sector in near_sectors
-            if sector['mothership'] and sector['mothership'].is_alive
+            sector.mothership for sector in near_sectors
+            if sector.mothership and sector.mothership.is_alive
         ]
         if len(near_motherships_alive) == 0:
-            front_sector = next((sector for sector in self.sectors if sector['front']), False)
-            if front_sector['mothership'] and front_sector['mothership'].is_alive:
-                teammates = self.get_drones(filters=[self.get_alive_obj, self.get_team_drones])
-                game_data = self.get_game_data()
-                number_enemy_soldiers = next((
-                    team['number_soldiers'] for team in game_data
-                    if team.get('team_name') == front_sector['team_name']
-                ), False)
+            front_sector = next((sector for sector in self.sectors if sector.front), False)
+            if front_sector.mothership and front_sector.mothership.is_alive:
+                teammates = self.snapshot.team_drones_alive
+                team = self.get_team_data(team_name=front_sector.team_name)
+                number_enemy_soldiers = team.number_soldiers if team else False
 
                 if self.is_risk_game() or number_enemy_soldiers + 3 <= len(teammates):
                     return LastBattleStrategy, {'sector': front_sector, 'base_attack': True}
@@ -179,15 +322,15 @@ class CommandCenter:
         """
         game_data = [
             team for team in self.get_game_data()
-            if team['team_name'] != self.my_mothership.team and team['number_soldiers'] == 0
+            if team.team_name != self.my_mothership.team and team.number_soldiers == 0
         ]
-        front_sector = next((sector for sector in self.sectors if sector['front']), False)
+        front_sector = next((sector for sector in self.sectors if sector.front), False)
         for team in game_data:
-            if team['team_name'] != front_sector['team_name']:
+            if team.team_name != front_sector.team_name:
                 sector_attack = next(
                     (
                         sector for sector in self.sectors
-                        if team['team_name'] == sector['team_name'] and sector['mothership'].is_alive
+                        if team.team_name == sector.team_name and sector.mothership.is_alive
                     ),
                     False
                 )
@@ -203,15 +346,15 @@ class CommandCenter:
         """
         game_data = [
             team for team in self.get_game_data()
-            if team['team_name'] != self.my_mothership.team and team['defenders'] == 0
+            if team.team_name != self.my_mothership.team and team.defenders == 0
         ]
-        front_sector = next((sector for sector in self.sectors if sector['front']), False)
+        front_sector = next((sector for sector in self.sectors if sector.front), False)
         for team in game_data:
-            if team['team_name'] != front_sector['team_name']:
+            if team.team_name != front_sector.team_name:
                 sector_attack = next(
                     (
                         sector for sector in self.sectors
-                        if team['team_name'] == sector['team_name'] and sector['mothership'].is_alive
+                        if team.team_name == sector.team_name and sector.mothership.is_alive
                     ),
                     False
                 )
@@ -225,18 +368,11 @@ class CommandCenter:
 
         :return: tuple
         """
-        enemy_sectors = [sector for sector in self.sectors if not sector['home_sector'] and not sector['front']]
+        enemy_sectors = [sector for sector in self.sectors if not sector.home_sector and not sector.front]
         for sector in enemy_sectors:
-            if sector['mothership'] and not sector['mothership'].is_alive:
-                enemy_team_data = next(
-                    (
-                        team for team in self.get_game_data()
-                        if team['team_name'] == sector['team_name'] and team['defenders'] != 0
-
-                    ),
-                    False
-                )
-                if enemy_team_data:
+            if sector.mothership and not sector.mothership.is_alive:
+                enemy_team_data = self.get_team_data(team_name=sector.team_name)
+                if enemy_team_data and enemy_team_data.defenders != 0:
                     return SabotageStrategy, {'sector': sector, 'base_attack': True}
 
     def attack_near_sector_with_risk_event(self):
@@ -247,18 +383,18 @@ class CommandCenter:
         """
         game_data = [
             team for team in self.get_game_data()
-            if team['team_name'] != self.my_mothership.team
+            if team.team_name != self.my_mothership.team
         ]
-        game_data_sorted = sorted(game_data, key=lambda x: x['defenders'])
-        front_sector = next((sector for sector in self.sectors if sector['front']), False)
-        teammates = self.get_drones(filters=[self.get_alive_obj, self.get_team_drones])
+        game_data_sorted = sorted(game_data, key=lambda x: x.defenders)
+        front_sector = next((sector for sector in self.sectors if sector.front), False)
+        teammates = self.snapshot.team_drones_alive
         for team in game_data_sorted:
-            if team['team_name'] != front_sector['team_name']:
-                if team['defenders'] + 3 <= len(teammates) or self.is_risk_game():
+            if team.team_name != front_sector.team_name:
+                if team.defenders + 3 <= len(teammates) or self.is_risk_game():
                     sector_attack = next(
                         (
                             sector for sector in self.sectors
-                            if team['team_name'] == sector['team_name'] and sector['mothership'].is_alive
+                            if team.team_name == sector.team_name and sector.mothership.is_alive
                         ),
                         False
                     )
@@ -271,16 +407,14 @@ class CommandCenter:
 
         :return: tuple
         """
-        enemy_sectors = [sector for sector in self.sectors if not sector['home_sector']]
+        enemy_sectors = [sector for sector in self.sectors if not sector.home_sector]
         for sector in enemy_sectors:
-            if self.get_objects_with_loot(sector=sector):
-                if not sector['mothership']:
+            if self.loot_index.has_loot(sector.index):
+                if not sector.mothership:
                     return HarvestStrategy, {'sector': sector}
                 else:
-                    team_name = sector['team_name']
-                    game_data = self.get_game_data()
-                    enemy_team = next((team for team in game_data if team.get('team_name') == team_name), False)
-                    number_enemy_drones = enemy_team['number_soldiers']
+                    enemy_team = self.get_team_data(team_name=sector.team_name)
+                    number_enemy_drones = enemy_team.number_soldiers
                     if number_enemy_drones == 0:
                         return HarvestStrategy, {'sector': sector}
 
@@ -307,10 +441,36 @@ class CommandCenter:
         Переход в новую стратегии или обновлении текущей стратегии.
         """
         if not isinstance(drone.strategy, strategy):
-            drone.strategy = strategy(drone=drone, **kwargs)
+            drone.strategy = self.get_strategy_pool(drone=drone).get(strategy, **kwargs)
         else:
             drone.strategy.update(**kwargs)
 
+    def get_strategy_pool(self, drone):
+        """
+        Получение набора созданных стратегий дрона.
+
+        :param drone: DontsovDrone
+        :return: StrategyPool
+        """
+        pool = self.strategy_pools.get(drone)
+        if pool is None:
+            pool = self.strategy_pools[drone] = StrategyPool(drone=drone)
+        return pool
+
+    def teardown(self):
+        """
+        Освобождение состояния командного центра по окончании игры.
+
+        Дроны команды отвязываются от центра, созданные стратегии и срез мира удаляются.
+        """
+        for drone, pool in self.strategy_pools.items():
+            pool.clear()
+            drone.strategy = None
+            if drone.command_center is self:
+                drone.command_center = None
+        self.strategy_pools = {}
+        self._snapshot = None
+
     def get_base_defender(self, team_name, mothership):
         """
         Получения списка дронов которые находятся в зоне хила у своей базы.
@@ -319,16 +479,15 @@ class CommandCenter:
         :param mothership: Mothership
         :return: List
         """
-        enemy_drones = self.get_drones(filters=[self.get_alive_obj, self.get_enemy_drones])
-        enemy_team = [drone for drone in enemy_drones if drone.set_team_name == team_name]
-        base_defender = [drone for drone in enemy_team if drone.distance_to(mothership) <= HEALING_DISTANCE]
+        enemy_drones = self.get_enemy_drones_in_radius(point=mothership, radius=HEALING_DISTANCE)
+        base_defender = [drone for drone in enemy_drones if drone.set_team_name == team_name]
         return base_defender
 
     def get_sorted_sectors(self):
         """
-        Возврат словаря с параметрами каждого сектора.
+        Возврат списка с параметрами каждого сектора.
 
-        :return: Dict
+        :return: List
         """
         sectors = []
         vector_to_center = Vector.from_points(point1=self.my_mothership.coord, point2=self.point_center_field)
@@ -336,49 +495,51 @@ class CommandCenter:
         diagonal = math.sqrt(FIELD_WIDTH ** 2 + FIELD_HEIGHT ** 2)
         vec = Vector.from_direction(direction=direction_to_center, module=.7 * diagonal)
         point_in_front_sector = self.my_mothership.coord + vec
-        for sector in self.unsorted_sectors:
-            front_sector = True if self.is_enter_in_sector(sector_coord=sector, obj=point_in_front_sector) else False
+        for index, sector in enumerate(self.unsorted_sectors):
+            front_sector = self.sector_geometry.is_inside(index=index, obj=point_in_front_sector)
             mship = self.get_mship_in_sector(sector)
             sectors.append(
-                {
-                    'front': front_sector,
-                    'home_sector': True if mship is self.my_mothership else False,
-                    'team_name': mship.team if mship else None,
-                    'mothership': mship,
-                    'coord': sector
-                }
+                Sector(
+                    index=index,
+                    front=front_sector,
+                    home_sector=True if mship is self.my_mothership else False,
+                    team_name=mship.team if mship else None,
+                    mothership=mship,
+                    coord=sector,
+                )
             )
         return sectors
 
     def get_game_data(self):
         """
-        Получение состояния армии противников
+        Получение состояния армии противников на текущий шаг игры.
 
-        :return: Dict
+        :return: List
         """
-        game_data = []
-        for drone in self.get_drones():
-            team = next((team for team in game_data if team.get('team_name') == drone.set_team_name), False)
-            if not team:
-                team = {'team_name': drone.set_team_name}
-                game_data.append(team)
+        return self.snapshot.game_data
 
-            if drone.is_alive:
-                team['number_soldiers'] = team.get('number_soldiers', 0) + 1
-                team['elirium'] = team.get('elirium', 0) + drone.payload
-            else:
-                team['number_soldiers'] = team.get('number_soldiers', 0)
-                team['elirium'] = team.get('elirium', 0)
+    def get_team_data(self, team_name):
+        """
+        Получение состояния армии команды на текущий шаг игры.
 
-        for mship in self.space_field.motherships:
-            team = next((team for team in game_data if team.get('team_name') == mship.team), False)
-            if mship.is_alive:
-                if not team:
-                    team = {'team_name': mship.team}
-                    game_data.append(team)
-                team['elirium'] = team.get('elirium', 0) + mship.payload
-            team['defenders'] = len(self.get_base_defender(team_name=mship.team, mothership=mship))
-        return game_data
+        :param team_name: str
+        :return: TeamStats or None
+        """
+        return self.snapshot.team_stats.get(team_name)
+
+    def build_game_data(self):
+        """
+        Состояние армий команд с количеством защитников вражеских баз на текущий шаг.
+
+        Защитники считаются запросом к пространственной сетке вокруг каждой базы противника.
+
+        :return: List
+        """
+        for team_name, mship in self.team_stats.motherships.items():
+            if self.is_enemy_mothership(mship):
+                defenders = self.get_base_defender(team_name=team_name, mothership=mship)
+                self.team_stats.set_defenders(team_name=team_name, defenders=len(defenders))
+        return self.team_stats.values()
 
     def get_mship_in_sector(self, sector_coord):
         """
@@ -400,45 +561,13 @@ class CommandCenter:
         :param sector_coord:  список с углами (точками) сектора
         :return: список дронов
         """
-        enemy_drones = self.get_drones(filters=[self.get_enemy_drones, self.get_alive_obj])
+        enemy_drones = self.snapshot.enemy_drones_alive
         drones_in_sector = [
             drone for drone in enemy_drones
             if self.is_enter_in_sector(sector_coord=sector_coord, obj=drone)
         ]
         return drones_in_sector
 
-    def get_drones(self, filters=None):
-        """
-        Получение дронов с заданными фильрами
-
-        :param filters: Список с функциями фильтрами
-        :return: List
-        """
-        drones = []
-        for team_name, teammates in self.space_field.teams.items():
-            for drone in teammates:
-                drones.append(drone)
-        if filters:
-            for add_filter in filters:
-                drones = add_filter(drones)
-        return drones
-
-    def get_enemy_motherships(self, filters=None):
-        """
-        Получение списка вражеских баз
-
-        :param filters: Список с функциями фильтрами
-        :return: List
-        """
-        enemy_motherships = []
-        for mothership in self.space_field.motherships:
-            if mothership.team != 'DontsovDrone':
-                enemy_motherships.append(mothership)
-        if filters:
-            for add_filter in filters:
-                enemy_motherships = add_filter(enemy_motherships)
-        return enemy_motherships
-
     @property
     def point_center_field(self):
         """
@@ -457,32 +586,7 @@ class CommandCenter:
 
         :return: List
         """
-        return [
-            [
-                Point(0, 0),
-                Point(FIELD_WIDTH / 2, 0),
-                self.point_center_field,
-                Point(0, FIELD_HEIGHT / 2)
-            ],
-            [
-                Point(0, FIELD_HEIGHT / 2),
-                self.point_center_field,
-                Point(FIELD_WIDTH / 2, FIELD_HEIGHT),
-                Point(0, FIELD_HEIGHT)
-            ],
-            [
-                Point(FIELD_WIDTH / 2, 0),
-                Point(FIELD_WIDTH, 0),
-                Point(FIELD_WIDTH, FIELD_HEIGHT / 2),
-                self.point_center_field
-            ],
-            [
-                self.point_center_field,
-                Point(FIELD_WIDTH, FIELD_HEIGHT / 2),
-                Point(FIELD_WIDTH, FIELD_HEIGHT),
-                Point(FIELD_WIDTH / 2, FIELD_HEIGHT)
-            ]
-        ]
+        return self.sector_geometry.corners
 
     @staticmethod
     def is_enter_in_sector(sector_coord, obj):
@@ -504,65 +608,42 @@ class CommandCenter:
         else:
             return False
 
-    @staticmethod
-    def get_alive_obj(objects):
-        """
-        Возвращает список живых объектов.
-
-        :param objects: Список объектов игры
-        :return: List
-        """
-        return [obj for obj in objects if obj.is_alive]
-
-    @staticmethod
-    def get_not_alive_obj(objects):
-        """
-        Возвращает список живых объектов.
-
-        :param objects: Список объектов игры
-        :return: List
+    def is_enemy_drone(self, obj):
         """
-        return [obj for obj in objects if not obj.is_alive]
+        Проверка принадлежности дрона команде противника.
 
-    @staticmethod
-    def filter_is_not_empty(objects):
-        """
-        Возвращает список объектов с элириумом.
-
-        :param objects: Список объектов игры
-        :return: List
+        :param obj: Drone
+        :return: True or False
         """
-        return [obj for obj in objects if not obj.is_empty]
+        return obj.team != self.team_name
 
-    @staticmethod
-    def get_enemy_drones(objects):
+    def is_team_drone(self, obj):
         """
-        Возвращает список вражеских дронов.
+        Проверка принадлежности дрона дружеской команде.
 
-        :param objects: Список дронов
-        :return: List
+        :param obj: Drone
+        :return: True or False
         """
-        return [obj for obj in objects if not isinstance(obj, DontsovDrone)]
+        return obj.team == self.team_name
 
-    @staticmethod
-    def get_team_drones(objects):
+    def is_enemy_mothership(self, mothership):
         """
-        Возвращает список дружеских дронов.
+        Проверка принадлежности базы команде противника.
 
-        :param objects: Список дронов
-        :return: List
+        :param mothership: MotherShip
+        :return: True or False
         """
-        return [obj for obj in objects if isinstance(obj, DontsovDrone)]
+        return mothership.team != self.team_name
 
-    def get_objects_in_radius_attack(self, drone, objects):
+    def get_enemy_drones_in_radius(self, point, radius):
         """
-        Возвращает список объектов, которые находятся в радиусе атаки дрона.
+        Возвращает список живых вражеских дронов не дальше radius от точки.
 
-        :param objects: Список объектов игры
-        :param drone: DontsovDrone
+        :param point: объект игры или точка
+        :param radius: float
         :return: List
         """
-        return [obj for obj in objects if self.is_radius_attack(drone, obj)]
+        return self.snapshot.spatial_index.query(point=point, radius=radius, layer=ENEMY_DRONES)
 
     def get_objects_with_loot(self, sector=None, safe_harvest=False, bait=True):
         """
@@ -572,20 +653,13 @@ class CommandCenter:
         :param safe_harvest: Boolean
         :return: List
         """
-        objects_with_loot = [aster for aster in self.space_field.asteroids if not aster.is_empty]
-        drones_with_loot = self.get_drones(filters=[self.get_not_alive_obj, self.filter_is_not_empty])
-        objects_with_loot.extend(drones_with_loot)
-        enemy_mships_with_loot = self.get_enemy_motherships(
-            filters=[self.get_not_alive_obj, self.filter_is_not_empty])
-        objects_with_loot.extend(enemy_mships_with_loot)
-        if safe_harvest:
-            objects_with_loot = self.get_safe_obj(objects_with_loot)
         if sector:
-            objects_with_loot = [
-                obj for obj in objects_with_loot
-                if self.is_enter_in_sector(sector_coord=sector['coord'], obj=obj)
-            ]
-        return objects_with_loot
+            objects_with_loot = self.loot_index.loot_by_sector[sector.index]
+        else:
+            objects_with_loot = self.loot_index.objects_with_loot
+        if safe_harvest:
+            return self.get_safe_obj(objects_with_loot)
+        return list(objects_with_loot)
 
     def get_safe_obj(self, objects):
         """
@@ -594,7 +668,19 @@ class CommandCenter:
         :param objects: Список объектов игры
         :return: List
         """
-        return [obj for obj in objects if self.is_obj_safe(obj)]
+        if not objects:
+            return []
+        safe_mask = self.get_safe_mask(objects)
+        return [obj for obj, is_safe in zip(objects, safe_mask) if is_safe]
+
+    def get_safe_mask(self, points):
+        """
+        Проверка нахождения набора точек или объектов игры вне зоны поражения за один вызов.
+
+        :param points: Список точек или объектов игры
+        :return: numpy.ndarray
+        """
+        return self.snapshot.threat_raster.classify(points)
 
     def is_radius_attack(self, drone, enemy):
         """
@@ -636,13 +722,7 @@ class CommandCenter:
         :param obj: объект игры
         :return: True or False
         """
-        enemy_alive_drones = self.get_drones(filters=[self.get_enemy_drones, self.get_alive_obj])
-        enemy_alive_drones_stay = [drone for drone in enemy_alive_drones if not drone.is_moving]
-        for drone in enemy_alive_drones_stay:
-            if drone.distance_to(obj) < RADIUS_ATTACK:
-                return False
-        else:
-            return True
+        return self.snapshot.threat_raster.is_safe(obj)
 
     def is_risk_game(self):
         """
@@ -652,11 +732,11 @@ class CommandCenter:
         """
         number_place = 0
         game_data = self.get_game_data()
-        game_data = sorted(game_data, key=lambda x: x['elirium'], reverse=True)
+        game_data = sorted(game_data, key=lambda x: x.elirium, reverse=True)
         for number_place, team in enumerate(game_data):
-            if team['team_name'] == 'DontsovDrone':
+            if team.team_name == self.team_name:
                 break
-        teammates = self.get_drones(filters=[self.get_alive_obj, self.get_team_drones])
+        teammates = self.snapshot.team_drones_alive
 
         if number_place > 1 and len(teammates) >= 4:
             return True
@@ -668,7 +748,7 @@ class CommandCenter:
         :return: Boolean
         """
         objects_with_loot = [mship.payload for mship in self.space_field.motherships]
-        objects_with_loot.extend([drone.payload for drone in self.get_drones()])
+        objects_with_loot.extend([drone.payload for drone in self.snapshot.drones])
         total_tank = sum(objects_with_loot)
         if total_tank < .9 * self.total_ellirium:
             return True
@@ -1,5 +1,24 @@
 # -*- coding: utf-8 -*-
 
 from .strategies_dontsov import DefenderStrategy, SabotageStrategy, \
-    HarvestStrategy, LastBattleStrategy
+    HarvestStrategy, LastBattleStrategy, StrategyPool
 from .constants import HEALING_DISTANCE, FIELD_HEIGHT, FIELD_WIDTH, RADIUS_ATTACK
+from .query import ObjectQuery, is_alive, is_dead, is_not_empty, is_moving, is_standing
+from .snapshot import WorldSnapshot, get_game_tick
+from .records import Record
+from .team_stats import TeamStats, TeamStatsStore
+from .spatial_index import SpatialGrid, ENEMY_DRONES
+from .threat_map import ThreatRaster
+from .sectors import Sector, SectorGeometry
+from .event_engine import EventEngine, EventRule
+from .planner import SquadPlanner
+from .profiler import HotPathProfiler, profiler
+from .harvest_planner import HarvestAssignment, WorkloadBalancer
+from .loot_index import LootIndex
+from .kinematics import KinematicTracker, get_heading_velocities
+from .fire_control import FireControl, solve_intercept, segment_hits_circles
+from .fire_allocation import FireAllocation
+from .formation import Formation
+from .path_planner import PathPlanner
+from .registry import CommandCenterRegistry
+from .recorder import WorldRecorder, WorldRecording, RECORD_DTYPE
@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*
 
+from .constants import RADIUS_ATTACK
+from .query import ObjectQuery, is_standing
+from .spatial_index import ENEMY_DRONES
+
+
 class BaseAction:
     """
     Класс базового состояния-действия.
     """
+    __slots__ = ('_drone', '_nav', '_sector')
+
     def __init__(self, **kwargs):
         self._drone = kwargs['drone']
         self._nav = self.drone.command_center
+        self.reset(**kwargs)
+
+    def reset(self, **kwargs):
+        """
+        Сброс состояния действия к начальному с новыми параметрами.
+        """
         self._sector = kwargs.get('sector')
 
     def go(self, strategy):
@@ -36,6 +49,8 @@ class LoadAction(BaseAction):
     """
     Класс состояния-действия Загрузки с объекта Элирума.
     """
+    __slots__ = ()
+
     def go(self, strategy):
         """
         Действия загрузки Элирума.
@@ -43,8 +58,9 @@ class LoadAction(BaseAction):
         :param strategy: Класс текущей стратегии
         """
         if not self.drone.is_full and not self.drone.target_move.is_empty:
-            enemy_drones = self.nav.get_drones(filters=[self.nav.get_enemy_drones, self.nav.get_alive_obj])
-            victim = next((drone for drone in enemy_drones if self.drone.near(drone) and not drone.is_moving), None)
+            enemy_drones = self.nav.snapshot.spatial_index.candidates(
+                point=self.drone, radius=RADIUS_ATTACK, layer=ENEMY_DRONES)
+            victim = ObjectQuery(objects=enemy_drones, predicates=(self.drone.near, is_standing)).first()
             target_load = victim if victim else self.drone.target_move
             self.drone.load_from(target_load)
         else:
@@ -61,6 +77,8 @@ class UnloadAction(BaseAction):
     """
     Класс состояния-действия Разгрузки Элирума.
     """
+    __slots__ = ()
+
     def go(self, strategy):
         """
         Действия разгрузки Элирума.
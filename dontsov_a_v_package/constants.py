@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from astrobox.themes.default import MOTHERSHIP_HEALING_DISTANCE, DRONE_SPEED, PROJECTILE_SPEED
+from astrobox.themes.default import MOTHERSHIP_HEALING_DISTANCE, DRONE_SPEED, PROJECTILE_SPEED, \
+    CARGO_TRANSITION_SPEED, MAX_DRONE_ELERIUM
 from astrobox.guns import PlasmaProjectile
 from robogame_engine.theme import theme
 
 DRONE_SPEED = DRONE_SPEED
 HEALING_DISTANCE = MOTHERSHIP_HEALING_DISTANCE
 PROJECTILE_SPEED = PROJECTILE_SPEED
+CARGO_TRANSITION_SPEED = CARGO_TRANSITION_SPEED
+MAX_DRONE_ELERIUM = MAX_DRONE_ELERIUM
 RADIUS_ATTACK = PlasmaProjectile.max_distance + PlasmaProjectile.radius * 4
 FIELD_WIDTH = theme.FIELD_WIDTH
 FIELD_HEIGHT = theme.FIELD_HEIGHT
+HEARTBEAT_INTERVAL = theme.HEARTBEAT_INTERVAL
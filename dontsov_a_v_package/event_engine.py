@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+_NOT_EVALUATED = object()
+
+
+class EventRule:
+    """
+    Событие выбора стратегии с объявленными входными данными.
+
+    Результат события запоминается и пересчитывается только при изменении входных данных.
+    """
+    def __init__(self, event, inputs):
+        self._event = event
+        self._inputs = tuple(inputs)
+        self._fingerprint = _NOT_EVALUATED
+        self._result = None
+
+    @property
+    def event(self):
+        return self._event
+
+    @event.setter
+    def event(self, new_event):
+        self._event = new_event
+        self.reset()
+
+    @property
+    def inputs(self):
+        return self._inputs
+
+    @property
+    def name(self):
+        return getattr(self._event, '__name__', repr(self._event))
+
+    def reset(self):
+        """
+        Сброс запомненного результата события.
+        """
+        self._fingerprint = _NOT_EVALUATED
+        self._result = None
+
+    def evaluate(self, fingerprint):
+        """
+        Получение результата события, пересчет только при изменении входных данных.
+
+        :param fingerprint: tuple со значениями входных данных
+        :return: tuple or None
+        """
+        if fingerprint != self._fingerprint:
+            self._result = self.run_event()
+            self._fingerprint = fingerprint
+        return self._result
+
+    def run_event(self):
+        """
+        Вычисление результата события.
+
+        :return: tuple or None
+        """
+        return self._event()
+
+
+class EventEngine:
+    """
+    Движок событий выбора стратегии с отслеживанием изменившихся входных данных.
+
+    События проверяются в порядке приоритета, входные данные вычисляются лениво
+    и не более одного раза за проверку.
+    """
+    def __init__(self, rules, inputs, default):
+        self._rules = list(rules)
+        self._inputs = inputs
+        self._default = default
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def __len__(self):
+        return len(self._rules)
+
+    @property
+    def rules(self):
+        return self._rules
+
+    def reset(self):
+        """
+        Сброс всех запомненных результатов.
+        """
+        for rule in self._rules:
+            rule.reset()
+
+    def resolve(self):
+        """
+        Получение стратегии первого сработавшего события.
+
+        :return: tuple
+        """
+        values = {}
+        result = self._default
+        for rule in self._rules:
+            for name in rule.inputs:
+                if name not in values:
+                    values[name] = self._inputs[name]()
+            rule_result = rule.evaluate(fingerprint=tuple(values[name] for name in rule.inputs))
+            if rule_result:
+                result = rule_result
+                break
+        return result
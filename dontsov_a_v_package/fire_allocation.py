@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+from .attack_action import AttackBaseAction
+from .constants import RADIUS_ATTACK
+from .spatial_index import get_coord
+
+
+class FireAllocation:
+    """
+    Распределение атакующих дронов по вражеским дронам на шаг игры.
+
+    Пары (атакующий, враг в радиусе атаки) упорядочиваются по расстоянию и жадно назначаются,
+    пока число атакующих по цели меньше допустимого: 2, если врагов в радиусе атаки дрона
+    больше, чем у него живых союзников, иначе 4. Распределение строится один раз за шаг
+    для дронов в состоянии атаки, остальные дроны добавляются по запросу.
+    """
+    def __init__(self, command_center, radius=RADIUS_ATTACK):
+        self._nav = command_center
+        self._radius = radius
+        self._tick = None
+        self._targets = {}
+        self._attackers_count = {}
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @staticmethod
+    def get_number_attack(enemies_count, teammates_count):
+        """
+        Получение максимального количества атакующих по одной цели.
+
+        :param enemies_count: количество врагов в радиусе атаки дрона
+        :param teammates_count: количество живых союзников дрона
+        :return: int
+        """
+        return 2 if enemies_count > teammates_count else 4
+
+    @staticmethod
+    def is_attacker(drone):
+        """
+        Проверка находится ли дрон в состоянии атаки.
+
+        :param drone: DontsovDrone
+        :return: True or False
+        """
+        strategy = getattr(drone, 'strategy', None)
+        return isinstance(getattr(strategy, 'current_action', None), AttackBaseAction)
+
+    def refresh(self):
+        """
+        Пересчет распределения при смене шага игры.
+        """
+        tick = self.nav.snapshot.tick
+        if tick is not None and tick == self._tick:
+            return
+        self._tick = tick
+        self._targets = {}
+        self._attackers_count = {}
+        self.solve(attackers=[drone for drone in self.nav.snapshot.team_drones_alive if self.is_attacker(drone)])
+
+    def solve(self, attackers):
+        """
+        Распределение атакующих по целям с учетом уже назначенных на шаге.
+
+        :param attackers: Список дронов
+        """
+        teammates_count = max(len(self.nav.snapshot.team_drones_alive) - 1, 0)
+        pairs = []
+        limits = []
+        for drone_number, drone in enumerate(attackers):
+            enemies = self.nav.get_enemy_drones_in_radius(point=drone, radius=self._radius)
+            limits.append(self.get_number_attack(len(enemies), teammates_count))
+            drone_coord = get_coord(drone)
+            for enemy in enemies:
+                enemy_coord = get_coord(enemy)
+                distance = ((drone_coord.x - enemy_coord.x) ** 2 + (drone_coord.y - enemy_coord.y) ** 2) ** .5
+                pairs.append((distance, drone_number, enemy))
+        pairs.sort(key=lambda pair: (pair[0], pair[1]))
+
+        for drone in attackers:
+            self._targets.setdefault(drone, None)
+        for _, drone_number, enemy in pairs:
+            drone = attackers[drone_number]
+            if self._targets[drone] is not None:
+                continue
+            if self._attackers_count.get(enemy, 0) < limits[drone_number]:
+                self._targets[drone] = enemy
+                self._attackers_count[enemy] = self._attackers_count.get(enemy, 0) + 1
+
+    def get_target(self, drone):
+        """
+        Получение вражеского дрона, назначенного дрону для атаки.
+
+        :param drone: DontsovDrone
+        :return: Drone or None
+        """
+        self.refresh()
+        if drone not in self._targets:
+            self.solve(attackers=[drone])
+        return self._targets[drone]
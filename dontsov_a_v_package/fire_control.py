@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from robogame_engine.geometry import Point
+
+from .constants import PROJECTILE_SPEED
+from .query import is_alive, is_moving
+from .spatial_index import get_coord
+
+
+def solve_intercept(shooters, targets, velocities, projectile_speed=PROJECTILE_SPEED):
+    """
+    Время встречи снаряда с целью для всех пар (стрелок, цель).
+
+    Решается уравнение |D + V * t| = P * t, где D - вектор от стрелка до цели,
+    V - скорость цели, P - скорость снаряда:
+    (V·V - P²) * t² + 2 * (D·V) * t + D·D = 0.
+    Берется наименьший неотрицательный корень, если встреча невозможна - время равно нулю.
+
+    :param shooters: numpy.ndarray формы (N, 2) с координатами стрелков
+    :param targets: numpy.ndarray формы (M, 2) с координатами целей
+    :param velocities: numpy.ndarray формы (M, 2) со скоростями целей
+    :param projectile_speed: скорость снаряда
+    :return: numpy.ndarray формы (N, M)
+    """
+    delta = targets[None, :, :] - shooters[:, None, :]
+    a = (velocities ** 2).sum(axis=-1)[None, :] - projectile_speed ** 2
+    b = 2 * (delta * velocities[None, :, :]).sum(axis=-1)
+    c = (delta ** 2).sum(axis=-1)
+    discriminant = b ** 2 - 4 * a * c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_discriminant = np.sqrt(np.maximum(discriminant, 0))
+        roots = np.stack([(-b - sqrt_discriminant) / (2 * a), (-b + sqrt_discriminant) / (2 * a)])
+        linear = np.where(b != 0, -c / b, 0)
+    roots = np.where(roots >= 0, roots, np.inf).min(axis=0)
+    roots[discriminant < 0] = np.inf
+    roots = np.where(np.abs(a) > 1e-9, roots, np.where(linear >= 0, linear, np.inf))
+    return np.where(np.isfinite(roots), roots, 0)
+
+
+def segment_hits_circles(start, end, centers, radii):
+    """
+    Проверка пересечения отрезка с окружностями.
+
+    Для каждой окружности находится ближайшая к центру точка отрезка
+    start + t * (end - start), t в [0, 1], и сравнивается расстояние до нее с радиусом.
+
+    :param start: numpy.ndarray формы (2,) с началом отрезка
+    :param end: numpy.ndarray формы (2,) с концом отрезка
+    :param centers: numpy.ndarray формы (N, 2) с центрами окружностей
+    :param radii: numpy.ndarray формы (N,) с радиусами окружностей
+    :return: numpy.ndarray формы (N,) типа bool
+    """
+    segment = end - start
+    length_square = segment @ segment
+    to_centers = centers - start
+    if length_square > 0:
+        t = np.clip(to_centers @ segment / length_square, 0, 1)
+    else:
+        t = np.zeros(len(centers))
+    nearest = start + t[:, None] * segment
+    return ((centers - nearest) ** 2).sum(axis=-1) <= radii ** 2
+
+
+class FireControl:
+    """
+    Таблица точек стрельбы на упреждение на шаг игры.
+
+    Один раз за шаг для всех пар (свой дрон, движущийся вражеский дрон) решается задача
+    встречи снаряда с целью, дроны получают точку стрельбы из готовой таблицы.
+    Скорости целей берутся из слежения за вражескими дронами, точки стрельбы -
+    из прогноза слежения на время встречи.
+    """
+    def __init__(self, command_center, projectile_speed=PROJECTILE_SPEED):
+        self._nav = command_center
+        self._projectile_speed = projectile_speed
+        self._tick = None
+        self._shooters = {}
+        self._targets = {}
+        self._aim_points = None
+        self._team_coords = np.zeros((0, 2))
+        self._team_radii = np.zeros(0)
+
+    @property
+    def nav(self):
+        return self._nav
+
+    def refresh(self):
+        """
+        Пересчет таблицы при смене шага игры.
+        """
+        tick = self.nav.snapshot.tick
+        if tick is not None and tick == self._tick:
+            return
+        self._tick = tick
+        shooters = self.nav.snapshot.team_drones_alive
+        targets = self.nav.snapshot.get_view(self.nav.is_enemy_drone, is_alive, is_moving)
+        self._shooters = {drone: number for number, drone in enumerate(shooters)}
+        self._targets = {drone: number for number, drone in enumerate(targets)}
+        self._aim_points = self.solve(shooters=shooters, targets=targets)
+        self._team_coords = np.array([(drone.coord.x, drone.coord.y) for drone in shooters], dtype=float).reshape(-1, 2)
+        self._team_radii = np.array([drone.radius for drone in shooters], dtype=float)
+
+    def solve(self, shooters, targets):
+        """
+        Точки стрельбы на упреждение для всех пар (стрелок, цель).
+
+        :param shooters: Список дронов
+        :param targets: Список движущихся дронов
+        :return: numpy.ndarray формы (N, M, 2)
+        """
+        shooters_coord = np.array([(drone.coord.x, drone.coord.y) for drone in shooters], dtype=float).reshape(-1, 2)
+        targets_coord = np.array([(drone.coord.x, drone.coord.y) for drone in targets], dtype=float).reshape(-1, 2)
+        velocities = self.nav.kinematics.get_velocities(targets)
+        times = solve_intercept(
+            shooters=shooters_coord,
+            targets=targets_coord,
+            velocities=velocities,
+            projectile_speed=self._projectile_speed,
+        )
+        return self.nav.kinematics.predict(drones=targets, ticks_ahead=times.T).transpose(1, 0, 2)
+
+    def get_aim_point(self, drone, enemy):
+        """
+        Получение точки для стрельбы по цели, на упреждение, если цель двигается.
+
+        :param drone: DontsovDrone
+        :param enemy: Drone
+        :return: Point
+        """
+        if not enemy.is_moving:
+            return enemy.coord
+        self.refresh()
+        shooter_number = self._shooters.get(drone)
+        target_number = self._targets.get(enemy)
+        if shooter_number is None or target_number is None:
+            x, y = self.solve(shooters=[drone], targets=[enemy])[0, 0]
+        else:
+            x, y = self._aim_points[shooter_number, target_number]
+        return Point(float(x), float(y))
+
+    def is_clear_shot(self, drone, target):
+        """
+        Проверка, что на линии выстрела нет дружественных дронов.
+
+        :param drone: DontsovDrone
+        :param target: объект игры или точка
+        :return: True or False
+        """
+        self.refresh()
+        start = np.array([drone.coord.x, drone.coord.y], dtype=float)
+        target_coord = get_coord(target)
+        end = np.array([target_coord.x, target_coord.y], dtype=float)
+        hits = segment_hits_circles(
+            start=start,
+            end=end,
+            centers=self._team_coords,
+            radii=self._team_radii + drone.gun.projectile.radius,
+        )
+        shooter_number = self._shooters.get(drone)
+        if shooter_number is not None:
+            hits[shooter_number] = False
+        else:
+            hits &= (self._team_coords != start).any(axis=-1)
+        return not hits.any()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from robogame_engine.geometry import Point, Vector
+
+
+class Formation:
+    """
+    Позиции построения дронов вокруг баз.
+
+    Позиции для набора (база, расстояние, сектор обзора) рассчитываются один раз и не зависят
+    от числа живых дронов: на дуге равномерно размещается по позиции на каждого дрона команды,
+    а выдаются они в порядке разнесенности - сначала позиция напротив центра поля, затем каждая
+    следующая как можно дальше от уже выданных. Поэтому любое число первых позиций покрывает
+    всю дугу, гибель дронов таблицу не перестраивает, а освободившиеся позиции занимают оставшиеся дроны.
+    Занятые позиции хранятся в карте резервирования позиция -> дрон: позиция свободна, если
+    ее никто не занимал или занявший дрон погиб либо сменил стартовую позицию.
+    """
+    def __init__(self, command_center):
+        self._nav = command_center
+        self._slots = {}
+        self._owners = {}
+        self._reservations = {}
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @property
+    def capacity(self):
+        """
+        Количество позиций на дуге - число дронов команды на поле, живых и погибших.
+
+        :return: int
+        """
+        return max(len(self.nav.space_field.teams.get(self.nav.team_name, ())), 1)
+
+    def get_slots(self, mothership, distance, angle):
+        """
+        Получение позиций вокруг базы в порядке их выдачи.
+
+        :param mothership: MotherShip
+        :param distance: float
+        :param angle: int
+        :return: List
+        """
+        key = (mothership, distance, angle)
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = self.build_slots(
+                center=mothership.coord,
+                distance=distance,
+                angle=angle,
+                count=self.capacity,
+            )
+        return slots
+
+    def build_slots(self, center, distance, angle, count):
+        """
+        Расчет позиций на дуге вокруг центра, обращенной к центру поля.
+
+        Одна позиция ставится напротив центра поля, несколько - от края до края дуги.
+
+        :param center: Point
+        :param distance: float
+        :param angle: int
+        :param count: int
+        :return: List
+        """
+        direction_to_center = Vector.from_points(point1=center, point2=self.nav.point_center_field).direction
+        if count == 1:
+            directions = [direction_to_center]
+        else:
+            step = 2 * angle / (count - 1)
+            directions = [direction_to_center - angle + number * step for number in range(count)]
+        slots = []
+        for number in self.get_spread_order(count):
+            radian = Vector.to_radian(directions[number])
+            slots.append((center.x + distance * math.cos(radian), center.y + distance * math.sin(radian)))
+        return slots
+
+    @staticmethod
+    def get_spread_order(count):
+        """
+        Порядок номеров позиций на дуге: сначала средняя, затем самая далекая от уже выбранных.
+
+        :param count: int
+        :return: List
+        """
+        order = [(count - 1) // 2]
+        distances = [abs(number - order[0]) for number in range(count)]
+        while len(order) < count:
+            farthest = max(range(count), key=lambda number: (distances[number], -number))
+            order.append(farthest)
+            distances = [min(distance, abs(number - farthest)) for number, distance in enumerate(distances)]
+        return order
+
+    def is_free(self, slot, drone):
+        """
+        Проверка свободна ли позиция для дрона.
+
+        :param slot: tuple с координатами позиции
+        :param drone: DontsovDrone
+        :return: True or False
+        """
+        owner = self._owners.get(slot)
+        if owner is None or owner is drone:
+            return True
+        position = owner.start_position
+        if owner.is_alive and position is not None and position.x == slot[0] and position.y == slot[1]:
+            return False
+        self.release(owner)
+        return True
+
+    def reserve(self, drone, mothership, distance, angle=60):
+        """
+        Выдача дрону первой свободной позиции вокруг базы.
+
+        :param drone: DontsovDrone
+        :param mothership: MotherShip
+        :param distance: float
+        :param angle: int
+        :return: Point or None
+        """
+        slots = self.get_slots(mothership=mothership, distance=distance, angle=angle)
+        slot = next((slot for slot in slots if self.is_free(slot=slot, drone=drone)), None)
+        self.release(drone)
+        if slot is None:
+            return None
+        self._owners[slot] = drone
+        self._reservations[drone] = slot
+        return Point(x=slot[0], y=slot[1])
+
+    def release(self, drone):
+        """
+        Освобождение позиции дрона.
+
+        :param drone: DontsovDrone
+        """
+        slot = self._reservations.pop(drone, None)
+        if slot is not None and self._owners.get(slot) is drone:
+            del self._owners[slot]
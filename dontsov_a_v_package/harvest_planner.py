@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from .base_actions import LoadAction
+from .constants import CARGO_TRANSITION_SPEED, DRONE_SPEED, MAX_DRONE_ELERIUM
+from .move_actions import MoveHarvestAction
+from .spatial_index import get_coord
+
+
+def get_distance(obj1, obj2):
+    """
+    Расстояние между объектами игры или точками.
+
+    :param obj1: объект игры или точка
+    :param obj2: объект игры или точка
+    :return: float
+    """
+    coord1, coord2 = get_coord(obj1), get_coord(obj2)
+    return math.hypot(coord1.x - coord2.x, coord1.y - coord2.y)
+
+
+class WorkloadBalancer:
+    """
+    Распределение сборщиков между ближним и дальним скоплениями элириума.
+
+    Объекты сортируются по расстоянию от своей базы и делятся на ближние и дальние
+    по половине наибольшего расстояния. Для каждого скопления оценивается отдача рейса -
+    элириум за рейс, деленный на время полета туда и обратно, загрузки и выгрузки.
+    Сборщики отдаются скоплению с лучшей отдачей, пока в нем хватает рейсов,
+    остальные уходят в другое скопление. В дальнее скопление отправляются дроны,
+    уже летящие туда, затем дроны, которым до него ближе всего относительно ближнего.
+    Разбиение выполняется один раз на план сбора за шаг, сложность O(n log n).
+    """
+    def __init__(self, command_center, speed=DRONE_SPEED, transfer_speed=CARGO_TRANSITION_SPEED,
+                 capacity=MAX_DRONE_ELERIUM):
+        self._nav = command_center
+        self._speed = speed
+        self._transfer_speed = transfer_speed
+        self._capacity = capacity
+
+    @property
+    def nav(self):
+        return self._nav
+
+    def get_trip(self, distance, payload):
+        """
+        Элириум и время одного рейса к объекту от базы и обратно.
+
+        :param distance: расстояние от базы до объекта
+        :param payload: элириум объекта
+        :return: tuple (элириум, количество шагов)
+        """
+        loaded = min(payload, self._capacity)
+        return loaded, 2 * distance / self._speed + 2 * loaded / self._transfer_speed
+
+    def get_cluster_stats(self, distances, objects):
+        """
+        Количество рейсов и отдача рейса скопления.
+
+        :param distances: Список расстояний от базы до объектов
+        :param objects: Список объектов скопления
+        :return: tuple (количество рейсов, элириум за шаг)
+        """
+        trips, elirium, time = 0, 0, 0
+        for distance, obj in zip(distances, objects):
+            loaded, duration = self.get_trip(distance=distance, payload=obj.payload)
+            count = int(math.ceil(obj.payload / self._capacity))
+            trips += count
+            elirium += loaded * count
+            time += duration * count
+        return trips, elirium / time if time else 0
+
+    def split(self, harvesters, objects):
+        """
+        Разбиение сборщиков и объектов на скопления.
+
+        :param harvesters: Список дронов
+        :param objects: Список объектов с элириумом
+        :return: List с tuple (Список дронов, Список объектов)
+        """
+        if len(objects) < 2 or len(harvesters) < 2:
+            return [(harvesters, objects)]
+
+        home = self.nav.my_mothership
+        ordered = sorted((get_distance(home, obj), number) for number, obj in enumerate(objects))
+        half_distance = ordered[-1][0] / 2
+        near = [(distance, objects[number]) for distance, number in ordered if distance <= half_distance]
+        far = [(distance, objects[number]) for distance, number in ordered if distance > half_distance]
+        if not near or not far:
+            return [(harvesters, objects)]
+        near_objects = [obj for _, obj in near]
+        far_objects = [obj for _, obj in far]
+        near_trips, near_return = self.get_cluster_stats([distance for distance, _ in near], near_objects)
+        far_trips, far_return = self.get_cluster_stats([distance for distance, _ in far], far_objects)
+
+        if near_return >= far_return:
+            far_count = max(len(harvesters) - near_trips, 0)
+        else:
+            far_count = min(len(harvesters), far_trips)
+        if not far_count:
+            return [(harvesters, objects)]
+
+        near_anchor, far_anchor = near_objects[0], far_objects[0]
+        far_set = set(far_objects)
+        ordered_harvesters = sorted(
+            harvesters,
+            key=lambda drone: (
+                drone.target_move not in far_set,
+                get_distance(drone, far_anchor) - get_distance(drone, near_anchor),
+            )
+        )
+        return [(ordered_harvesters[far_count:], near_objects), (ordered_harvesters[:far_count], far_objects)]
+
+
+class HarvestAssignment:
+    """
+    Распределение сборщиков по объектам с элириумом на шаг игры.
+
+    Пары (дрон, объект) упорядочиваются по стоимости - расстоянию на единицу элириума,
+    которую дрон сможет забрать, после чего жадно назначаются, пока у объекта остается
+    нераспределенный элириум. Дроны, уже летящие к объекту, сохраняют его в первую очередь.
+    Распределение выполняется один раз за шаг для каждого набора параметров сбора
+    между дронами, которые летят к элириуму или загружаются, дроны получают готовую цель.
+    Перед распределением WorkloadBalancer делит сборщиков между ближним и дальним
+    скоплениями, дроны без цели в своем скоплении распределяются по оставшемуся
+    элириуму всего поля.
+    """
+    def __init__(self, command_center):
+        self._nav = command_center
+        self._tick = None
+        self._plans = {}
+        self.balancer = WorkloadBalancer(command_center=command_center)
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @staticmethod
+    def is_harvester(drone):
+        """
+        Проверка занят ли дрон сбором элириума: летит к объекту с элириумом или загружается.
+
+        :param drone: DontsovDrone
+        :return: True or False
+        """
+        if drone.is_full:
+            return False
+        strategy = getattr(drone, 'strategy', None)
+        return isinstance(getattr(strategy, 'current_action', None), (MoveHarvestAction, LoadAction))
+
+    def get_target(self, drone, sector=None, safe_harvest=False):
+        """
+        Получение цели сбора для дрона.
+
+        :param drone: DontsovDrone
+        :param sector: Dict с параметрами сектора
+        :param safe_harvest: Boolean
+        :return: GameObject or None
+        """
+        tick = self.nav.snapshot.tick
+        if tick is None or tick != self._tick:
+            self._plans = {}
+            self._tick = tick
+        key = (sector.index if sector else None, bool(safe_harvest))
+        plan = self._plans.get(key)
+        if plan is None:
+            objects = self.nav.get_objects_with_loot(sector=sector, safe_harvest=safe_harvest)
+            harvesters = [mate for mate in self.nav.snapshot.team_drones_alive if self.is_harvester(mate)]
+            plan = self._plans[key] = (self.balance(harvesters=harvesters, objects=objects), objects, set(harvesters))
+        targets, objects, planned = plan
+        if drone not in planned:
+            planned.add(drone)
+            targets.update(self.solve(harvesters=[drone], objects=self.get_free_objects(targets, objects)))
+        return targets.get(drone)
+
+    def balance(self, harvesters, objects):
+        """
+        Распределение сборщиков по объектам внутри скоплений.
+
+        :param harvesters: Список дронов
+        :param objects: Список объектов с элириумом
+        :return: Dict дрон -> объект
+        """
+        clusters = self.balancer.split(harvesters=harvesters, objects=objects)
+        targets = {}
+        for cluster_harvesters, cluster_objects in clusters:
+            targets.update(self.solve(harvesters=cluster_harvesters, objects=cluster_objects))
+        idle = [drone for drone in harvesters if drone not in targets]
+        if idle and len(clusters) > 1:
+            targets.update(self.solve(harvesters=idle, objects=self.get_free_objects(targets, objects)))
+        return targets
+
+    @staticmethod
+    def get_cost(drone, obj):
+        """
+        Стоимость сбора: расстояние до объекта на единицу элириума, которую заберет дрон.
+
+        :param drone: DontsovDrone
+        :param obj: GameObject
+        :return: float
+        """
+        loaded = min(drone.free_space, obj.payload)
+        if loaded <= 0:
+            return None
+        drone_coord, obj_coord = get_coord(drone), get_coord(obj)
+        distance = ((drone_coord.x - obj_coord.x) ** 2 + (drone_coord.y - obj_coord.y) ** 2) ** .5
+        return distance / loaded
+
+    def solve(self, harvesters, objects):
+        """
+        Распределение сборщиков по объектам.
+
+        :param harvesters: Список дронов
+        :param objects: Список объектов с элириумом
+        :return: Dict дрон -> объект
+        """
+        pairs = []
+        for drone_number, drone in enumerate(harvesters):
+            for obj_number, obj in enumerate(objects):
+                cost = self.get_cost(drone, obj)
+                if cost is not None:
+                    pairs.append((drone.target_move is not obj, cost, drone_number, obj_number))
+        pairs.sort()
+
+        remaining = [obj.payload for obj in objects]
+        targets = {}
+        for _, cost, drone_number, obj_number in pairs:
+            drone = harvesters[drone_number]
+            if drone in targets or remaining[obj_number] <= 0:
+                continue
+            targets[drone] = objects[obj_number]
+            remaining[obj_number] -= drone.free_space
+        return targets
+
+    @staticmethod
+    def get_free_objects(targets, objects):
+        """
+        Объекты, элириум которых не полностью распределен между сборщиками.
+
+        :param targets: Dict дрон -> объект
+        :param objects: Список объектов с элириумом
+        :return: List
+        """
+        reserved = {}
+        for drone, obj in targets.items():
+            reserved[obj] = reserved.get(obj, 0) + drone.free_space
+        return [obj for obj in objects if reserved.get(obj, 0) < obj.payload]
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from .constants import DRONE_SPEED, HEARTBEAT_INTERVAL
+
+TRACK_LENGTH = 4
+MAX_SAMPLE_GAP = HEARTBEAT_INTERVAL
+
+
+def get_heading_velocities(drones, speed=DRONE_SPEED):
+    """
+    Скорости дронов по направлению их корпуса, у стоящих дронов скорость нулевая.
+
+    :param drones: Список дронов
+    :param speed: модуль скорости
+    :return: numpy.ndarray формы (количество дронов, 2)
+    """
+    radians = np.radians([drone.vector.direction for drone in drones])
+    moving = np.array([drone.is_moving for drone in drones], dtype=bool)
+    velocities = speed * np.stack([np.cos(radians), np.sin(radians)], axis=-1).reshape(-1, 2)
+    velocities[~moving] = 0
+    return velocities
+
+
+class KinematicTracker:
+    """
+    Слежение за движением вражеских дронов между шагами игры.
+
+    Каждому дрону выделяется строка в массивах NumPy с кольцевым буфером последних
+    TRACK_LENGTH снимков положений и шагов, на которых они сняты. Снимки делаются
+    не чаще одного раза за шаг, когда кто-то из дронов команды принимает решение,
+    обычно раз в интервал heartbeat, и положения всех дронов записываются в буфер
+    одним присваиванием. Скорости пересчитываются для всех дронов сразу при первом
+    запросе на шаге: у движущихся дронов по смещению от предыдущего снимка, если он
+    сделан не раньше чем max_gap шагов назад, иначе или если дрон только тронулся -
+    по направлению корпуса, у стоящих дронов скорость нулевая. Вместе со скоростями
+    пересчитываются направления движения. Прогноз положений строится сразу
+    для набора дронов и набора горизонтов от последних снимков из буфера.
+    """
+    def __init__(self, length=TRACK_LENGTH, max_gap=MAX_SAMPLE_GAP, speed=DRONE_SPEED, capacity=16):
+        self._length = length
+        self._max_gap = max_gap
+        self._speed = speed
+        self._rows = {}
+        self._positions = np.zeros((capacity, length, 2))
+        self._times = np.full((capacity, length), -1, dtype=np.int64)
+        self._velocities = np.zeros((capacity, 2))
+        self._headings = np.zeros(capacity)
+        self._tick = None
+        self._time = None
+        self._samples = 0
+        self._drones = []
+        self._drones_rows = np.zeros(0, dtype=np.int64)
+        self._is_velocities_actual = True
+
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def max_gap(self):
+        return self._max_gap
+
+    @property
+    def tick(self):
+        return self._tick
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, drone):
+        return drone in self._rows
+
+    def get_rows(self, drones, add=False):
+        """
+        Номера строк дронов в массивах слежения.
+
+        :param drones: Список дронов
+        :param add: выделять ли строки дронам, за которыми еще не следили
+        :return: numpy.ndarray с номерами строк, -1 для дронов без строки
+        """
+        if add:
+            for drone in drones:
+                if drone not in self._rows:
+                    self.add(drone)
+        return np.array([self._rows.get(drone, -1) for drone in drones], dtype=np.int64)
+
+    def add(self, drone):
+        """
+        Выделение строки дрону, при нехватке места массивы увеличиваются вдвое.
+
+        :param drone: Drone
+        :return: int
+        """
+        row = self._rows[drone] = len(self._rows)
+        capacity = len(self._velocities)
+        if row >= capacity:
+            extra = capacity
+            self._positions = np.concatenate([self._positions, np.zeros((extra, self._length, 2))])
+            self._times = np.concatenate([self._times, np.full((extra, self._length), -1, dtype=np.int64)])
+            self._velocities = np.concatenate([self._velocities, np.zeros((extra, 2))])
+            self._headings = np.concatenate([self._headings, np.zeros(extra)])
+        return row
+
+    def update(self, tick, drones):
+        """
+        Запись положений дронов, не чаще одного раза за шаг игры.
+
+        При смене набора дронов скорости предыдущего набора оцениваются до записи,
+        чтобы выбывшие дроны сохранили скорость последнего снимка для прогноза.
+
+        :param tick: номер шага игры или None
+        :param drones: Список живых вражеских дронов
+        """
+        if tick is not None and tick == self._tick:
+            return
+        self._tick = tick
+        self._samples += 1
+        if drones != self._drones:
+            self.refresh_velocities()
+            self._drones_rows = self.get_rows(drones, add=True)
+        self._drones = drones
+        if not drones:
+            return
+        time = self._time = self._samples if tick is None else tick
+        column = self._samples % self._length
+        self._positions[self._drones_rows, column] = [(drone.coord.x, drone.coord.y) for drone in drones]
+        self._times[self._drones_rows, column] = time
+        self._is_velocities_actual = False
+
+    def refresh_velocities(self):
+        """
+        Оценка скоростей и направлений движения всех дронов, записанных на последнем шаге слежения.
+        """
+        if self._is_velocities_actual:
+            return
+        self._is_velocities_actual = True
+        drones = self._drones
+        rows = self._drones_rows
+        if not drones:
+            return
+        order = np.argsort(self._times[rows], axis=-1)
+        latest = order[:, -1]
+        previous = order[:, -2]
+        previous_times = self._times[rows, previous]
+        elapsed = self._times[rows, latest] - previous_times
+        velocities = (self._positions[rows, latest] - self._positions[rows, previous]) / np.maximum(elapsed, 1)[:, None]
+        moving = np.array([drone.is_moving for drone in drones], dtype=bool)
+        is_measured = moving & (previous_times >= 0) & (elapsed > 0) & (elapsed <= self._max_gap) \
+            & velocities.any(axis=-1)
+        velocities[~moving] = 0
+        if not (is_measured | ~moving).all():
+            is_heading = moving & ~is_measured
+            velocities[is_heading] = get_heading_velocities(
+                [drone for drone, heading in zip(drones, is_heading) if heading], speed=self._speed)
+        self._velocities[rows] = velocities
+        headings = np.degrees(np.arctan2(velocities[:, 1], velocities[:, 0])) % 360
+        standing = ~velocities.any(axis=-1)
+        headings[standing] = [drone.vector.direction for drone, is_standing in zip(drones, standing) if is_standing]
+        self._headings[rows] = headings
+
+    def get_velocities(self, drones):
+        """
+        Скорости дронов, оцененные на последнем шаге слежения.
+
+        Для дронов без строки скорость берется по направлению корпуса.
+
+        :param drones: Список дронов
+        :return: numpy.ndarray формы (количество дронов, 2)
+        """
+        self.refresh_velocities()
+        rows = self.get_rows(drones)
+        velocities = self._velocities[np.maximum(rows, 0)].reshape(-1, 2)
+        unknown = rows < 0
+        if unknown.any():
+            velocities[unknown] = get_heading_velocities(
+                [drone for drone, row in zip(drones, rows) if row < 0], speed=self._speed)
+        return velocities
+
+    def get_headings(self, drones):
+        """
+        Направления движения дронов в градусах, оцененные на последнем шаге слежения.
+
+        У стоящих дронов и дронов без строки берется направление корпуса.
+
+        :param drones: Список дронов
+        :return: numpy.ndarray формы (количество дронов,)
+        """
+        self.refresh_velocities()
+        rows = self.get_rows(drones)
+        headings = self._headings[np.maximum(rows, 0)].reshape(-1)
+        unknown = rows < 0
+        if unknown.any():
+            headings[unknown] = [drone.vector.direction for drone, row in zip(drones, rows) if row < 0]
+        return headings
+
+    def predict(self, drones, ticks_ahead):
+        """
+        Прогноз положений дронов через заданное количество шагов.
+
+        Прогноз строится от последнего снимка дрона в буфере с учетом шагов, прошедших
+        с этого снимка до последнего шага слежения, для дронов без строки - от текущего положения.
+        Для скалярного горизонта возвращается массив формы (количество дронов, 2),
+        для набора горизонтов формы (K,) - общего для всех дронов - или формы
+        (количество дронов, K) - своего для каждого дрона - массив формы (количество дронов, K, 2).
+
+        :param drones: Список дронов
+        :param ticks_ahead: число или numpy.ndarray
+        :return: numpy.ndarray
+        """
+        velocities = self.get_velocities(drones)
+        rows = self.get_rows(drones)
+        known = rows >= 0
+        latest = np.argmax(self._times[np.maximum(rows, 0)].reshape(-1, self._length), axis=-1)
+        coords = self._positions[np.maximum(rows, 0), latest].reshape(-1, 2)
+        elapsed = np.zeros(len(drones))
+        if known.any():
+            elapsed[known] = self._time - self._times[rows[known], latest[known]]
+        if not known.all():
+            coords[~known] = [(drone.coord.x, drone.coord.y) for drone, row in zip(drones, rows) if row < 0]
+        ticks_ahead = np.asarray(ticks_ahead, dtype=float)
+        if ticks_ahead.ndim == 0:
+            return coords + (elapsed + ticks_ahead)[:, None] * velocities
+        if ticks_ahead.ndim == 1:
+            ticks_ahead = ticks_ahead[None, :]
+        return coords[:, None, :] + (elapsed[:, None] + ticks_ahead)[:, :, None] * velocities[:, None, :]
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+import bisect
+import heapq
+import math
+
+from .spatial_index import get_coord
+
+ASTEROID = 'asteroid'
+DRONE = 'drone'
+MOTHERSHIP = 'mothership'
+
+
+class LootIndex:
+    """
+    Индекс объектов игры с элириумом, разложенных по секторам.
+
+    Каждому возможному источнику элириума - астероиду, дрону, базе - один раз выдается ранг:
+    сначала астероиды, затем дроны, затем базы, в порядке их следования на поле.
+    В корзине сектора хранится отсортированный список рангов объектов с элириумом,
+    поэтому порядок объектов совпадает с порядком полного обхода поля.
+
+    Индекс обновляется по событиям: после загрузки и выгрузки дронов команды и при гибели
+    дронов и баз командный центр перепроверяет изменившиеся объекты через update.
+    Загрузка элириума дронами противников событий не вызывает, поэтому на новом шаге
+    перепроверяются только объекты, уже лежащие в индексе: их могли опустошить,
+    а погибший дрон мог сместиться в другой сектор. Живые дроны и базы не перепроверяются.
+    Добавление и удаление объекта в корзине - двоичный поиск по рангу, наличие элириума
+    в секторе проверяется за константное время. Ближайший к точке объект ищется по секторам
+    в порядке расстояния до их границ, сектор и все следующие за ним пропускаются,
+    если граница сектора дальше уже найденного объекта.
+    """
+    def __init__(self, command_center):
+        self._nav = command_center
+        self._tick = None
+        self._size = None
+        self._objects = []
+        self._kinds = []
+        self._ranks = {}
+        self._sectors = []
+        self._buckets = []
+        self._indexed = set()
+        self._version = 0
+        self._cache_version = None
+        self._objects_with_loot = ()
+        self._loot_by_sector = ()
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @property
+    def version(self):
+        """
+        Номер версии индекса, увеличивается при каждом изменении корзин секторов.
+
+        :return: int
+        """
+        return self._version
+
+    def __len__(self):
+        self.refresh()
+        return len(self._indexed)
+
+    def __contains__(self, obj):
+        self.refresh()
+        rank = self._ranks.get(obj)
+        return rank is not None and rank in self._indexed
+
+    def get_sources(self):
+        """
+        Все возможные источники элириума на поле с их видами.
+
+        :return: List с tuple (объект игры, вид)
+        """
+        sources = [(asteroid, ASTEROID) for asteroid in self.nav.space_field.asteroids]
+        sources.extend((drone, DRONE) for drone in self.nav.snapshot.drones)
+        sources.extend((mship, MOTHERSHIP) for mship in self.nav.space_field.motherships)
+        return sources
+
+    def refresh(self):
+        """
+        Обновление индекса при смене шага игры.
+
+        Если на поле появились новые объекты, индекс перестраивается целиком,
+        иначе перепроверяются только объекты с элириумом.
+        """
+        tick = self.nav.snapshot.tick
+        if tick is not None and tick == self._tick:
+            return
+        self._tick = tick
+        size = len(self.nav.space_field.asteroids) + len(self.nav.snapshot.drones) \
+            + len(self.nav.space_field.motherships)
+        if size != self._size:
+            self._size = size
+            self.rebuild()
+            return
+        for rank in list(self._indexed):
+            self.update_rank(rank)
+
+    def rebuild(self):
+        """
+        Полное построение индекса.
+        """
+        sources = self.get_sources()
+        self._objects = [obj for obj, _ in sources]
+        self._kinds = [kind for _, kind in sources]
+        self._ranks = {obj: rank for rank, obj in enumerate(self._objects)}
+        self._sectors = [None] * len(self._objects)
+        self._buckets = [[] for _ in range(len(self.nav.sector_geometry))]
+        self._indexed = set()
+        self._version += 1
+        for rank in range(len(self._objects)):
+            self.update_rank(rank)
+
+    def is_loot(self, obj, kind):
+        """
+        Проверка, можно ли забрать элириум с объекта.
+
+        :param obj: объект игры
+        :param kind: вид объекта
+        :return: True or False
+        """
+        if obj.is_empty:
+            return False
+        if kind == ASTEROID:
+            return True
+        if obj.is_alive:
+            return False
+        return kind == DRONE or self.nav.is_enemy_mothership(obj)
+
+    def update(self, obj):
+        """
+        Перепроверка одного объекта игры после загрузки, выгрузки или гибели.
+
+        :param obj: объект игры
+        :return: True, если объект в индексе
+        """
+        rank = self._ranks.get(obj)
+        if rank is None:
+            return False
+        return self.update_rank(rank)
+
+    def update_rank(self, rank):
+        """
+        Перепроверка объекта по рангу и перенос его в корзину сектора или из нее.
+
+        :param rank: int
+        :return: True, если объект в индексе
+        """
+        obj, kind = self._objects[rank], self._kinds[rank]
+        has_loot = self.is_loot(obj, kind)
+        sector = self.nav.sector_geometry.get_index(obj) if has_loot else None
+        if sector != self._sectors[rank]:
+            if self._sectors[rank] is not None:
+                bucket = self._buckets[self._sectors[rank]]
+                del bucket[bisect.bisect_left(bucket, rank)]
+                self._indexed.discard(rank)
+            if sector is not None:
+                bisect.insort(self._buckets[sector], rank)
+                self._indexed.add(rank)
+            self._sectors[rank] = sector
+            self._version += 1
+        return has_loot
+
+    def refresh_cache(self):
+        if self._cache_version == self._version:
+            return
+        self._cache_version = self._version
+        objects = self._objects
+        self._loot_by_sector = tuple(tuple(objects[rank] for rank in bucket) for bucket in self._buckets)
+        self._objects_with_loot = tuple(objects[rank] for rank in sorted(self._indexed))
+
+    @property
+    def objects_with_loot(self):
+        """
+        Объекты игры с элириумом в порядке рангов.
+
+        Кортеж пересобирается только после изменения индекса.
+
+        :return: tuple
+        """
+        self.refresh()
+        self.refresh_cache()
+        return self._objects_with_loot
+
+    @property
+    def loot_by_sector(self):
+        """
+        Объекты игры с элириумом, разложенные по индексам секторов.
+
+        :return: tuple с tuple объектов для каждого сектора
+        """
+        self.refresh()
+        self.refresh_cache()
+        return self._loot_by_sector
+
+    def has_loot(self, sector_index):
+        """
+        Проверка наличия элириума в секторе.
+
+        :param sector_index: int
+        :return: True or False
+        """
+        self.refresh()
+        return bool(self._buckets[sector_index])
+
+    def get_nearest(self, point, sector_index=None):
+        """
+        Ближайший к точке объект с элириумом.
+
+        Секторы извлекаются из очереди с приоритетом по расстоянию от точки до их границ,
+        первым идет сектор точки. Поиск останавливается, когда граница очередного сектора
+        дальше найденного объекта.
+
+        :param point: объект игры или точка
+        :param sector_index: искать только в этом секторе
+        :return: объект игры или None
+        """
+        self.refresh()
+        coord = get_coord(point)
+        if sector_index is None:
+            sectors = [(self.get_bounds_distance(coord, index), index) for index in range(len(self._buckets))]
+        else:
+            sectors = [(0, sector_index)]
+        heapq.heapify(sectors)
+        nearest, nearest_distance = None, math.inf
+        while sectors:
+            bounds_distance, index = heapq.heappop(sectors)
+            if bounds_distance >= nearest_distance:
+                break
+            for rank in self._buckets[index]:
+                obj_coord = get_coord(self._objects[rank])
+                distance = math.hypot(obj_coord.x - coord.x, obj_coord.y - coord.y)
+                if distance < nearest_distance:
+                    nearest, nearest_distance = self._objects[rank], distance
+        return nearest
+
+    def get_bounds_distance(self, coord, sector_index):
+        """
+        Расстояние от точки до прямоугольника сектора.
+
+        :param coord: Point
+        :param sector_index: int
+        :return: float
+        """
+        min_x, min_y, max_x, max_y = self.nav.sector_geometry.bounds[sector_index]
+        dx = max(min_x - coord.x, 0, coord.x - max_x)
+        dy = max(min_y - coord.y, 0, coord.y - max_y)
+        return math.hypot(dx, dy)
@@ -6,12 +6,14 @@ from robogame_engine.geometry import Point, Vector
 
 from .base_actions import BaseAction
 from .constants import HEALING_DISTANCE
+from .query import ObjectQuery, is_alive
 
 
 class MoveBaseAction(BaseAction):
     """
     Базовый класс действия-состояния движения дрона.
     """
+    __slots__ = ()
 
     @staticmethod
     def is_same_points(point1, point2):
@@ -34,13 +36,10 @@ class MoveBaseAction(BaseAction):
         :param point: Point
         :return: True or False
         """
-        teammates_is_alive = [drone for drone in self.drone.teammates if drone.is_alive]
-        for drone in teammates_is_alive:
-            if drone.start_position:
-                if self.is_same_points(point1=point, point2=drone.start_position):
-                    return False
-        else:
-            return True
+        taken = ObjectQuery(objects=self.drone.teammates, predicates=(is_alive,)).where(
+            lambda drone: drone.start_position and self.is_same_points(point1=point, point2=drone.start_position)
+        )
+        return not taken.exists()
 
     def get_position_on_circle(self, distance, mothership, angle=60):
         """
@@ -51,22 +50,7 @@ class MoveBaseAction(BaseAction):
         :param angle: int
         :return: Point
         """
-        direction_to_center = self.get_direction_attack(
-            start_point=mothership.coord,
-            end_point=self.nav.point_center_field)
-        direction_to_center = int(direction_to_center)
-        number_guard = len([drone for drone in self.drone.teammates if drone.is_alive])
-        number_guard = 1 if number_guard == 0 else number_guard
-        start_angle = direction_to_center - angle
-        end_angle = direction_to_center + angle
-        step = int((end_angle - start_angle) / number_guard)
-        for direction in range(start_angle, end_angle + 1, step):
-            radian = Vector.to_radian(direction)
-            y = mothership.coord.y + distance * math.sin(radian)
-            x = mothership.coord.x + distance * math.cos(radian)
-            point = Point(x=x, y=y)
-            if self.is_valid_point(point):
-                return point
+        return self.nav.formation.reserve(drone=self.drone, mothership=mothership, distance=distance, angle=angle)
 
     @staticmethod
     def get_direction_attack(start_point, end_point):
@@ -89,6 +73,7 @@ class MoveBaseAction(BaseAction):
 
 class MoveDefenderAction(MoveBaseAction):
     """Класс действия-состояния передвижения на позицию защиты базы."""
+    __slots__ = ('safe_distance',)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -126,10 +111,13 @@ class MoveDefenderAction(MoveBaseAction):
 class MoveHarvestAction(MoveBaseAction):
     """Класс действи
 я-состояния передвижения на точку сбора Элириума."""
+    __slots__ = ('_safe_harvest',)
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._sector = kwargs.get('sector')
+    def reset(self, **kwargs):
+        """
+        Сброс состояния действия к начальному с новыми параметрами.
+        """
+        super().reset(**kwargs)
         self._safe_harvest = kwargs.get('safe_harvest')
 
     @property
@@ -157,82 +145,34 @@ class MoveHarvestAction(MoveBaseAction):
 
     def get_target_move(self):
         """
-        Получение точки передвижения.
+        Получение точки передвижения из распределения сборщиков на текущий шаг.
 
         :return: GameObject
         """
-        objects_with_loot = self.nav.get_objects_with_loot(sector=self.sector, safe_harvest=self.safe_harvest)
-        if objects_with_loot:
-            objects_with_loot_free = [obj for obj in objects_with_loot if self.is_obj_free_for_group(obj)]
-            if objects_with_loot_free:
-                return min(objects_with_loot_free, key=self.drone.distance_to)
-
-    def is_obj_free_for_solo(self, obj):
-        """
-        Проверка для фильтрации объектов игры с лутом, для одиночного дрона.
-
-        :param obj: GameObject
-        :return: True or False
-        """
-        for drone in self.drone.teammates:
-            if drone.target_move == obj:
-                return False
-        else:
-            return True
-
-    def is_obj_free_for_group(self, obj):
-        """
-        Проверка для фильтрации объектов игры с лутом, для группового дрона.
-
-        :param obj: GameObject
-        :return: True or False
-        """
-        teammates_alive = [drone for drone in self.drone.teammates if drone.target_move == obj and drone.is_alive]
-        if teammates_alive:
-            if sum([drone.free_space for drone in teammates_alive]) < obj.payload:
-                return True
-            else:
-                return False
-        else:
-            return True
-
-    def is_need_drone(self):
-        priority_asteroids = self.separated_asteroids['priority_asteroids']
-        priority_asteroids_not_empty = [asteroid for asteroid in priority_asteroids if not asteroid.is_empty]
-        half_distance = self.drone.distance_to(max(priority_asteroids_not_empty, key=self.drone.distance_to)) / 2
-        distant_asteroids = [
-            asteroid for asteroid in priority_asteroids_not_empty
-            if self.drone.distance_to(asteroid) > half_distance
-        ]
-        drones_with_first_target = [
-            drone.target for drone in self.drone.teammates
-            if drone.target in priority_asteroids_not_empty
-        ]
-        if len(distant_asteroids) > 1.4 * (len(priority_asteroids_not_empty) - len(distant_asteroids)):
-            if len(drones_with_first_target) < len(self.drone.teammates) // 2 + 1:
-                return True
-            else:
-                return False
-        else:
-            if len(drones_with_first_target) < len(self.drone.teammates) // 2:
-                return True
-            else:
-                return False
+        return self.nav.harvest_assignment.get_target(
+            drone=self.drone,
+            sector=self.sector,
+            safe_harvest=self.safe_harvest
+        )
 
 
 class MoveToSector(MoveBaseAction):
     """Класс действия-состояния передвижения на позицию атаки боковых баз врага."""
+    __slots__ = ('_start_sector', 'current_sector', 'direction_attack')
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def reset(self, **kwargs):
+        """
+        Сброс состояния действия к начальному с новыми параметрами.
+        """
+        super().reset(**kwargs)
         self.drone.target_move = None
         self.drone.start_position = None
         self._start_sector = kwargs.get('start_sector')
         self.current_sector = self.sector
         self.direction_attack = self.get_direction_attack(
             start_point=self.nav.my_mothership.coord
-            if self.start_sector is None else self.start_sector['mothership'].coord,
-            end_point=self.sector['mothership'].coord
+            if self.start_sector is None else self.start_sector.mothership.coord,
+            end_point=self.sector.mothership.coord
         )
 
     @property
@@ -252,7 +192,7 @@ class MoveToSector(MoveBaseAction):
         if not self.drone.is_empty:
             self.unload_move(strategy)
         else:
-            if self.current_sector['team_name'] != self.sector['team_name']:
+            if self.current_sector.team_name != self.sector.team_name:
                 self.reload_attr()
 
             if self.drone.start_position is None:
@@ -263,7 +203,8 @@ class MoveToSector(MoveBaseAction):
                     self.drone.target_move = self.get_target_move()
                     strategy.current_action = strategy.attack_action
                 else:
-                    self.drone.move_at(self.drone.target_move)
+                    waypoint = self.nav.path_planner.get_waypoint(drone=self.drone, target=self.drone.target_move)
+                    self.drone.move_at(waypoint)
 
             if self.drone.start_position is self.drone.my_mothership:
                 self.drone.start_position = self.get_start_position()
@@ -277,8 +218,8 @@ class MoveToSector(MoveBaseAction):
         """
         self.direction_attack = self.get_direction_attack(
             start_point=self.nav.my_mothership.coord
-            if self.start_sector is None else self.start_sector['mothership'].coord,
-            end_point=self.sector['mothership'].coord
+            if self.start_sector is None else self.start_sector.mothership.coord,
+            end_point=self.sector.mothership.coord
         )
         self.drone.start_position = None
         self.current_sector = self.sector
@@ -289,10 +230,8 @@ class MoveToSector(MoveBaseAction):
 
         :return: Point
         """
-        game_data = self.nav.get_game_data()
-        team_name = self.sector['team_name']
-        defender_team = next((team for team in game_data if team.get('team_name') == team_name))
-        module = 10 if defender_team['number_soldiers'] else 60
+        defender_team = self.nav.get_team_data(team_name=self.sector.team_name)
+        module = 10 if defender_team.number_soldiers else 60
         if self.drone.target_move is self.nav.my_mothership:
             return self.drone.target_move
         else:
@@ -304,9 +243,9 @@ class MoveToSector(MoveBaseAction):
 
         :return: tuple
         """
-        team_drones = self.nav.get_drones(filters=[self.nav.get_alive_obj, self.nav.get_team_drones])
+        team_drones = self.nav.snapshot.team_drones_alive
         numbers_team = len(team_drones)
-        mothership = self.nav.my_mothership if self.start_sector is None else self.start_sector['mothership']
+        mothership = self.nav.my_mothership if self.start_sector is None else self.start_sector.mothership
         diagonal = math.sqrt(2 * mothership.radius ** 2)
         diagonal = round(diagonal, 0)
         cathet = 2 * numbers_team * self.drone.radius + self.drone.radius
@@ -363,10 +302,15 @@ class MoveToSector(MoveBaseAction):
         step = int(2 * self.drone.radius)
         start_range = int(min_coord + self.drone.radius)
         end_range = int(max_coord)
-        for coord_half in range(start_range, end_range, step):
-            coord_full = {attr_main: coord_half, attr_second: attr_second_bottom}
-            point_new = Point(**coord_full)
-            if self.is_valid_point(point_new) and self.nav.is_obj_safe(obj=point_new):
+        points = [
+            Point(**{attr_main: coord_half, attr_second: attr_second_bottom})
+            for coord_half in range(start_range, end_range, step)
+        ]
+        if not points:
+            return None
+        safe_mask = self.nav.get_safe_mask(points)
+        for point_new, is_safe in zip(points, safe_mask):
+            if is_safe and self.is_valid_point(point_new):
                 return point_new
         else:
             return None
@@ -374,13 +318,20 @@ class MoveToSector(MoveBaseAction):
 
 class MoveLastSectorAction(MoveBaseAction):
     """Класс действия-состояния передвижения на позицию атаки центральной базы врага."""
+    __slots__ = ('safe_distance', 'direction_attack')
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.safe_distance = .8 * HEALING_DISTANCE + self.drone.gun.shot_distance
+
+    def reset(self, **kwargs):
+        """
+        Сброс состояния действия к начальному с новыми параметрами.
+        """
+        super().reset(**kwargs)
         self.drone.target_move = None
         self.drone.start_position = None
         self.direction_attack = None
-        self.safe_distance = .8 * HEALING_DISTANCE + self.drone.gun.shot_distance
 
     def go(self, strategy):
         """
@@ -406,7 +357,7 @@ class MoveLastSectorAction(MoveBaseAction):
 
         :return: Point
         """
-        enemy_alive_drones = self.nav.get_drones(filters=[self.nav.get_alive_obj, self.nav.get_enemy_drones])
+        enemy_alive_drones = self.nav.snapshot.enemy_drones_alive
         module = 10 if enemy_alive_drones else 70
         return self.drone.target_move + Vector.from_direction(direction=self.direction_attack, module=module)
 
@@ -418,18 +369,19 @@ class MoveLastSectorAction(MoveBaseAction):
         """
         self.drone.start_position = self.get_position_on_circle(
             distance=self.safe_distance,
-            mothership=self.sector['mothership'],
+            mothership=self.sector.mothership,
             angle=45
         )
         self.direction_attack = self.get_direction_attack(
             start_point=self.drone.start_position,
-            end_point=self.sector['mothership'].coord
+            end_point=self.sector.mothership.coord
         )
         self.drone.target_move = self.drone.start_position
 
 
 class MoveRecoveryAction(MoveBaseAction):
     """Класс действия-состояния передвижения на базу с целью лечения дрона."""
+    __slots__ = ()
 
     def go(self, strategy):
         """
@@ -452,6 +404,7 @@ class MoveRecoveryAction(MoveBaseAction):
 
 class MoveHomeAction(MoveRecoveryAction):
     """Класс действия-состояния передвижения на базу с целью лечения дрона или выгрузки лута."""
+    __slots__ = ()
 
     def go(self, strategy):
         """
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+import heapq
+import math
+
+import numpy as np
+from robogame_engine.geometry import Point
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH, HEALING_DISTANCE
+from .spatial_index import get_coord
+
+PATH_CELL_SIZE = 40
+THREAT_COST = 20.
+MOTHERSHIP_COST = 10.
+
+
+class PathPlanner:
+    """
+    Поиск безопасного пути A* по грубой сетке стоимостей.
+
+    Стоимость ячейки увеличивается в зонах поражения неподвижных вражеских дронов
+    и в зонах вражеских баз. Сетка перестраивается только при изменении растра угроз
+    или состава живых баз, каждое перестроение увеличивает версию сетки.
+    Пути запоминаются по ключу (начальная ячейка, конечная ячейка, версия сетки)
+    и используются всеми дронами, которые летят в одном направлении.
+    """
+    def __init__(self, command_center, cell_size=PATH_CELL_SIZE, width=FIELD_WIDTH, height=FIELD_HEIGHT):
+        self._nav = command_center
+        self._cell_size = float(cell_size)
+        self._columns = max(int(math.ceil(width / self._cell_size)), 1)
+        self._rows = max(int(math.ceil(height / self._cell_size)), 1)
+        xs = (np.arange(self._columns) + .5) * self._cell_size
+        ys = (np.arange(self._rows) + .5) * self._cell_size
+        self._centers_x, self._centers_y = np.meshgrid(xs, ys)
+        self._costs = np.ones((self._rows, self._columns))
+        self._tick = None
+        self._source = None
+        self._version = 0
+        self._paths = {}
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @property
+    def version(self):
+        """
+        Номер версии сетки стоимостей, увеличивается при каждом перестроении.
+
+        :return: int
+        """
+        return self._version
+
+    @property
+    def costs(self):
+        return self._costs
+
+    def refresh(self):
+        """
+        Перестроение сетки стоимостей при изменении угроз, не чаще одного раза за шаг игры.
+        """
+        tick = self.nav.snapshot.tick
+        if tick is not None and tick == self._tick:
+            return
+        self._tick = tick
+        raster = self.nav.snapshot.threat_raster
+        motherships = tuple(
+            mship for mship in self.nav.space_field.motherships
+            if mship.is_alive and mship is not self.nav.my_mothership
+        )
+        source = (raster.version, motherships)
+        if source == self._source:
+            return
+        self._source = source
+        self._version += 1
+        self._paths = {}
+        self._costs = 1. + THREAT_COST * self.get_danger_cells(raster)
+        for mship in motherships:
+            in_zone = (self._centers_x - mship.coord.x) ** 2 + (self._centers_y - mship.coord.y) ** 2 \
+                <= HEALING_DISTANCE ** 2
+            self._costs[in_zone] += MOTHERSHIP_COST
+
+    def get_danger_cells(self, raster):
+        """
+        Ячейки сетки, задевающие зоны поражения растра угроз.
+
+        :param raster: ThreatRaster
+        :return: numpy.ndarray типа bool формы (строки, столбцы)
+        """
+        danger = raster.danger
+        factor = self._cell_size / raster.resolution
+        row_starts = np.minimum((np.arange(self._rows) * factor).astype(int), danger.shape[0] - 1)
+        column_starts = np.minimum((np.arange(self._columns) * factor).astype(int), danger.shape[1] - 1)
+        danger = np.logical_or.reduceat(danger, row_starts, axis=0)
+        return np.logical_or.reduceat(danger, column_starts, axis=1)
+
+    def get_cell(self, obj):
+        """
+        Получение ячейки сетки, в которой находится объект игры или точка.
+
+        :param obj: объект игры или точка
+        :return: tuple (строка, столбец)
+        """
+        coord = get_coord(obj)
+        row = min(max(int(coord.y // self._cell_size), 0), self._rows - 1)
+        column = min(max(int(coord.x // self._cell_size), 0), self._columns - 1)
+        return row, column
+
+    def get_center(self, cell):
+        """
+        Получение центра ячейки.
+
+        :param cell: tuple (строка, столбец)
+        :return: Point
+        """
+        return Point(float(self._centers_x[cell]), float(self._centers_y[cell]))
+
+    def find_path(self, start, goal):
+        """
+        Поиск пути A* между ячейками с 8 соседями.
+
+        :param start: tuple (строка, столбец)
+        :param goal: tuple (строка, столбец)
+        :return: List ячеек от start до goal или None
+        """
+        costs = self._costs
+        queue = [(0., 0., start)]
+        came_from = {start: None}
+        distances = {start: 0.}
+        while queue:
+            _, distance, cell = heapq.heappop(queue)
+            if cell == goal:
+                path = []
+                while cell is not None:
+                    path.append(cell)
+                    cell = came_from[cell]
+                return path[::-1]
+            if distance > distances[cell]:
+                continue
+            row, column = cell
+            for d_row in (-1, 0, 1):
+                for d_column in (-1, 0, 1):
+                    next_row, next_column = row + d_row, column + d_column
+                    if (d_row or d_column) and 0 <= next_row < self._rows and 0 <= next_column < self._columns:
+                        step = math.hypot(d_row, d_column)
+                        next_distance = distance + step * costs[next_row, next_column]
+                        next_cell = (next_row, next_column)
+                        if next_distance < distances.get(next_cell, math.inf):
+                            distances[next_cell] = next_distance
+                            came_from[next_cell] = cell
+                            heuristic = math.hypot(goal[0] - next_row, goal[1] - next_column)
+                            heapq.heappush(queue, (next_distance + heuristic, next_distance, next_cell))
+        return None
+
+    def get_line_cost(self, start, goal):
+        """
+        Наибольшая стоимость ячеек на отрезке между центрами ячеек без начальной и конечной.
+
+        :param start: tuple (строка, столбец)
+        :param goal: tuple (строка, столбец)
+        :return: float
+        """
+        samples = int(2 * max(abs(goal[0] - start[0]), abs(goal[1] - start[1]))) + 1
+        rows = np.rint(np.linspace(start[0], goal[0], samples + 1)).astype(int)
+        columns = np.rint(np.linspace(start[1], goal[1], samples + 1)).astype(int)
+        inner = ((rows != start[0]) | (columns != start[1])) & ((rows != goal[0]) | (columns != goal[1]))
+        costs = self._costs[rows[inner], columns[inner]]
+        return float(costs.max()) if costs.size else 0.
+
+    def get_waypoints(self, start, goal):
+        """
+        Получение точек поворота пути между ячейками.
+
+        Участок пути заменяется отрезком, если отрезок не проходит через ячейки дороже,
+        чем самая дорогая ячейка участка.
+
+        :param start: tuple (строка, столбец)
+        :param goal: tuple (строка, столбец)
+        :return: List ячеек без начальной или None, если путь не найден
+        """
+        key = (start, goal, self._version)
+        if key in self._paths:
+            return self._paths[key]
+        path = self.find_path(start=start, goal=goal)
+        waypoints = None
+        if path is not None:
+            path_costs = [self._costs[cell] for cell in path]
+            waypoints = []
+            current = 0
+            while current < len(path) - 1:
+                following = next(
+                    number for number in range(len(path) - 1, current, -1)
+                    if number == current + 1
+                    or self.get_line_cost(path[current], path[number]) <= max(path_costs[current + 1:number])
+                )
+                waypoints.append(path[following])
+                current = following
+        self._paths[key] = waypoints
+        return waypoints
+
+    def get_waypoint(self, drone, target):
+        """
+        Получение ближайшей точки пути дрона к цели.
+
+        Если до цели можно долететь по прямой, возвращается сама цель.
+
+        :param drone: DontsovDrone
+        :param target: объект игры или точка
+        :return: Point или объект игры
+        """
+        self.refresh()
+        start = self.get_cell(drone)
+        goal = self.get_cell(target)
+        if start == goal:
+            return target
+        waypoints = self.get_waypoints(start=start, goal=goal)
+        if not waypoints or waypoints[0] == goal:
+            return target
+        return self.get_center(waypoints[0])
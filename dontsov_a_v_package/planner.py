@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+_NOT_PLANNED = object()
+
+
+class SquadPlanner:
+    """
+    Планирование действий отряда один раз за шаг игры.
+
+    Стратегия отряда выбирается движком событий при первом запросе на шаге,
+    остальные дроны получают уже выбранную стратегию.
+    """
+    def __init__(self, command_center):
+        self._nav = command_center
+        self._tick = _NOT_PLANNED
+        self._plan = None
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @property
+    def tick(self):
+        return None if self._tick is _NOT_PLANNED else self._tick
+
+    @property
+    def plan(self):
+        """
+        Стратегия отряда и ее параметры на текущий шаг.
+
+        :return: tuple
+        """
+        self.refresh()
+        return self._plan
+
+    def reset(self):
+        """
+        Сброс плана, следующий запрос выполнит планирование заново.
+        """
+        self._tick = _NOT_PLANNED
+        self._plan = None
+
+    def refresh(self):
+        """
+        Выполнение планирования, если план устарел.
+        """
+        tick = self.nav.snapshot.tick
+        if tick is None or tick != self._tick:
+            self._plan = self.nav.events.resolve()
+            self._tick = tick
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import functools
+import json
+import time
+
+from .base_actions import BaseAction
+from .event_engine import EventRule
+
+HISTOGRAM_BUCKETS = 24
+NAV_HELPERS = (
+    'get_game_data',
+    'get_team_data',
+    'get_objects_with_loot',
+    'get_safe_obj',
+    'get_safe_mask',
+    'get_enemy_drones_in_radius',
+    'get_base_defender',
+    'is_obj_safe',
+    'is_radius_attack',
+    'is_need_heal',
+    'is_risk_game',
+    'is_start_game',
+)
+
+
+class CallStats:
+    """
+    Количество вызовов и гистограмма длительности вызовов.
+
+    Корзина гистограммы с ключом 2 ** i содержит вызовы короче 2 ** i микросекунд, но не короче 2 ** (i - 1).
+    """
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0.
+        self.min = None
+        self.max = 0.
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, latency):
+        """
+        Учет одного вызова.
+
+        :param latency: длительность вызова в секундах
+        """
+        self.count += 1
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = max(self.max, latency)
+        bucket = min(int(latency * 10 ** 6).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'count': self.count,
+            'total_us': self.total * 10 ** 6,
+            'mean_us': self.total / self.count * 10 ** 6 if self.count else 0,
+            'min_us': (self.min or 0) * 10 ** 6,
+            'max_us': self.max * 10 ** 6,
+            'histogram_us': {
+                2 ** bucket: number
+                for bucket, number in enumerate(self.histogram) if number
+            },
+        }
+
+
+class HotPathProfiler:
+    """
+    Профилировщик событий CommandCenter, действий дронов и вспомогательных методов навигации.
+
+    При включении методы классов подменяются обертками с замером времени,
+    при выключении исходные методы возвращаются, так что выключенный профилировщик
+    не добавляет накладных расходов.
+    """
+    def __init__(self):
+        self._stats = {}
+        self._patches = []
+
+    @property
+    def enabled(self):
+        return bool(self._patches)
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def enable(self, command_center_class):
+        """
+        Включение замеров.
+
+        :param command_center_class: класс CommandCenter
+        """
+        if self.enabled:
+            return
+        self.patch(EventRule, 'run_event', lambda rule: 'event.' + rule.name)
+        for action_class in self.get_action_classes():
+            if 'go' in vars(action_class):
+                self.patch(action_class, 'go', lambda action, name=action_class.__name__: 'action.' + name)
+        for helper in NAV_HELPERS:
+            if helper in vars(command_center_class):
+                self.patch(command_center_class, helper, lambda nav, name=helper: 'nav.' + name)
+
+    def disable(self):
+        """
+        Выключение замеров и восстановление исходных методов.
+        """
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches = []
+
+    def reset(self):
+        """
+        Сброс накопленной статистики.
+        """
+        self._stats.clear()
+
+    @staticmethod
+    def get_action_classes():
+        """
+        Получение всех классов действий.
+
+        :return: List
+        """
+        classes = [BaseAction]
+        for action_class in classes:
+            classes.extend(sub for sub in action_class.__subclasses__() if sub not in classes)
+        return classes
+
+    def patch(self, owner, attr, get_name):
+        """
+        Подмена метода класса оберткой с замером времени.
+
+        :param owner: класс
+        :param attr: имя метода
+        :param get_name: функция получения имени замера по объекту вызова
+        """
+        original = vars(owner)[attr]
+        stats = self._stats
+
+        @functools.wraps(original)
+        def wrapper(obj, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                latency = time.perf_counter() - start
+                name = get_name(obj)
+                call_stats = stats.get(name)
+                if call_stats is None:
+                    call_stats = stats[name] = CallStats(name=name)
+                call_stats.add(latency)
+
+        setattr(owner, attr, wrapper)
+        self._patches.append((owner, attr, original))
+
+    def as_list(self):
+        """
+        Статистика вызовов, отсортированная по суммарному времени.
+
+        :return: List
+        """
+        return [stats.as_dict() for stats in sorted(self._stats.values(), key=lambda x: x.total, reverse=True)]
+
+    def export_json(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.as_list(), file, indent=2)
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['name', 'count', 'total_us', 'mean_us', 'min_us', 'max_us', 'histogram_us'])
+            for stats in self.as_list():
+                writer.writerow([
+                    stats['name'], stats['count'], round(stats['total_us'], 1), round(stats['mean_us'], 1),
+                    round(stats['min_us'], 1), round(stats['max_us'], 1),
+                    ' '.join('{}:{}'.format(bucket, number) for bucket, number in stats['histogram_us'].items()),
+                ])
+
+    def export(self, path):
+        """
+        Выгрузка статистики в CSV или JSON в зависимости от расширения файла.
+
+        :param path: str
+        """
+        if path.endswith('.csv'):
+            self.export_csv(path)
+        else:
+            self.export_json(path)
+
+
+profiler = HotPathProfiler()
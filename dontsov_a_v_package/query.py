@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+
+def is_alive(obj):
+    """
+    Проверка живой ли объект игры.
+
+    :param obj: объект игры
+    :return: True or False
+    """
+    return obj.is_alive
+
+
+def is_dead(obj):
+    """
+    Проверка погиб ли объект игры.
+
+    :param obj: объект игры
+    :return: True or False
+    """
+    return not obj.is_alive
+
+
+def is_not_empty(obj):
+    """
+    Проверка наличия элириума у объекта игры.
+
+    :param obj: объект игры
+    :return: True or False
+    """
+    return not obj.is_empty
+
+
+def is_moving(obj):
+    """
+    Проверка движется ли дрон.
+
+    :param obj: Drone
+    :return: True or False
+    """
+    return obj.is_moving
+
+
+def is_standing(obj):
+    """
+    Проверка стоит ли дрон на месте.
+
+    :param obj: Drone
+    :return: True or False
+    """
+    return not obj.is_moving
+
+
+class ObjectQuery:
+    """
+    Ленивый запрос к списку объектов игры.
+
+    Предикаты накапливаются вызовами where и применяются за один проход по объектам
+    только при обходе запроса: фильтры вложены друг в друга, и каждый объект проходит
+    всю цепочку, прежде чем будет взят следующий. Для first, exists и count списки
+    не строятся, first и exists останавливают обход на первом подходящем объекте.
+    """
+    __slots__ = ('_objects', '_predicates')
+
+    def __init__(self, objects, predicates=()):
+        self._objects = objects
+        self._predicates = tuple(predicates)
+
+    @property
+    def predicates(self):
+        return self._predicates
+
+    def where(self, *predicates):
+        """
+        Новый запрос с дополнительными предикатами.
+
+        :param predicates: функции obj -> True or False
+        :return: ObjectQuery
+        """
+        return ObjectQuery(objects=self._objects, predicates=self._predicates + predicates)
+
+    def __iter__(self):
+        objects = iter(self._objects)
+        for predicate in self._predicates:
+            objects = filter(predicate, objects)
+        return objects
+
+    def first(self, default=None):
+        """
+        Первый объект, прошедший все предикаты.
+
+        :param default: значение, если подходящих объектов нет
+        :return: объект игры или default
+        """
+        return next(iter(self), default)
+
+    def exists(self):
+        """
+        Проверка наличия хотя бы одного подходящего объекта.
+
+        :return: True or False
+        """
+        return next(iter(self), None) is not None
+
+    def count(self):
+        """
+        Количество подходящих объектов.
+
+        :return: int
+        """
+        return sum(1 for _ in self)
+
+    def to_list(self):
+        """
+        Список подходящих объектов.
+
+        :return: List
+        """
+        return list(self)
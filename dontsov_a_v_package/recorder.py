@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import numpy as np
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH
+
+KIND_MOTHERSHIP = 0
+KIND_ASTEROID = 1
+KIND_DRONE = 2
+KINDS = ('mothership', 'asteroid', 'drone')
+NO_TEAM = -1
+
+RECORD_DTYPE = np.dtype([
+    ('tick', '<i4'),
+    ('kind', 'u1'),
+    ('id', '<i4'),
+    ('team', '<i2'),
+    ('alive', '?'),
+    ('moving', '?'),
+    ('x', '<f8'),
+    ('y', '<f8'),
+    ('direction', '<f4'),
+    ('health', '<f4'),
+    ('payload', '<f4'),
+])
+INDEX_DTYPE = np.dtype([
+    ('tick', '<i4'),
+    ('start', '<i8'),
+])
+
+
+def get_meta_path(path):
+    """
+    Путь к файлу описания записи.
+
+    :param path: путь к файлу записи
+    :return: str
+    """
+    return path + '.json'
+
+
+def get_index_path(path):
+    """
+    Путь к файлу индекса шагов записи.
+
+    :param path: путь к файлу записи
+    :return: str
+    """
+    return path + '.index'
+
+
+class WorldRecorder:
+    """
+    Запись состояния мира на каждом шаге игры в двоичный файл.
+
+    Каждый объект игры - база, астероид или дрон - записывается в файл одной записью
+    фиксированной длины RECORD_DTYPE, записи только дописываются в конец файла.
+    Имена команд хранятся в файле описания рядом с записью, в записях - номер команды.
+    Для каждого шага в файл индекса дописывается номер шага и индекс его первой записи,
+    поэтому при чтении записи шага находятся без просмотра всего файла.
+    """
+    def __init__(self, path, team_name=None):
+        self._path = path
+        self._team_name = team_name
+        self._file = None
+        self._index_file = None
+        self._teams = {}
+        self._ticks = 0
+        self._records_count = 0
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def team_name(self):
+        return self._team_name
+
+    @team_name.setter
+    def team_name(self, new_team_name):
+        self._team_name = new_team_name
+        if self._file is not None:
+            self.write_meta()
+
+    @property
+    def ticks(self):
+        """
+        Количество записанных шагов игры.
+
+        :return: int
+        """
+        return self._ticks
+
+    def open(self):
+        """
+        Открытие файла записи, содержимое существующего файла удаляется.
+        """
+        self._file = open(self._path, 'wb')
+        self._index_file = open(get_index_path(self._path), 'wb')
+        self._teams = {}
+        self._ticks = 0
+        self._records_count = 0
+        self.write_meta()
+        return self
+
+    def close(self):
+        """
+        Закрытие файла записи.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._index_file.close()
+            self._file = None
+            self._index_file = None
+            self.write_meta()
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_team_id(self, team):
+        """
+        Получение номера команды, новая команда получает следующий номер.
+
+        :param team: имя команды или None
+        :return: int
+        """
+        if team is None:
+            return NO_TEAM
+        team_id = self._teams.get(team)
+        if team_id is None:
+            team_id = self._teams[team] = len(self._teams)
+            self.write_meta()
+        return team_id
+
+    def write_meta(self):
+        with open(get_meta_path(self._path), 'w') as file:
+            json.dump({
+                'dtype': RECORD_DTYPE.descr,
+                'kinds': KINDS,
+                'teams': sorted(self._teams, key=self._teams.get),
+                'team_name': self._team_name,
+                'field': [FIELD_WIDTH, FIELD_HEIGHT],
+                'ticks': self._ticks,
+            }, file, indent=2)
+
+    def write(self, tick, motherships, asteroids, drones):
+        """
+        Запись состояния объектов игры на шаге.
+
+        :param tick: номер шага игры
+        :param motherships: Список баз
+        :param asteroids: Список астероидов
+        :param drones: Список дронов
+        """
+        get_team_id = self.get_team_id
+        rows = [
+            (tick, KIND_MOTHERSHIP, mship.id, get_team_id(mship.team), mship.is_alive, False,
+             mship.coord.x, mship.coord.y, 0, mship.health, mship.payload)
+            for mship in motherships
+        ]
+        rows.extend(
+            (tick, KIND_ASTEROID, asteroid.id, NO_TEAM, True, False,
+             asteroid.coord.x, asteroid.coord.y, 0, 0, asteroid.payload)
+            for asteroid in asteroids
+        )
+        rows.extend(
+            (tick, KIND_DRONE, drone.id, get_team_id(drone.team), drone.is_alive, drone.is_moving,
+             drone.coord.x, drone.coord.y, drone.direction, drone.health, drone.payload)
+            for drone in drones
+        )
+        records = np.array(rows, dtype=RECORD_DTYPE)
+        records.tofile(self._file)
+        np.array([(tick, self._records_count)], dtype=INDEX_DTYPE).tofile(self._index_file)
+        self._records_count += len(records)
+        self._ticks += 1
+
+    def write_scene(self, tick, scene):
+        """
+        Запись состояния игрового поля на шаге.
+
+        :param tick: номер шага игры
+        :param scene: SpaceField
+        """
+        self.write(
+            tick=tick,
+            motherships=scene.motherships,
+            asteroids=scene.asteroids,
+            drones=[drone for drones in scene.teams.values() for drone in drones],
+        )
+
+
+class WorldRecording:
+    """
+    Чтение записи состояния мира через отображение файла в память.
+
+    Файл не загружается целиком: записи нужных шагов читаются по срезам,
+    границы шагов берутся из файла индекса, который тоже отображается в память.
+    Для записей без файла индекса границы шагов находятся одним проходом по номерам шагов.
+    """
+    def __init__(self, path):
+        with open(get_meta_path(path)) as file:
+            self._meta = json.load(file)
+        self._records = self.load(path, dtype=RECORD_DTYPE)
+        index_path = get_index_path(path)
+        if os.path.exists(index_path):
+            self._index = self.load(index_path, dtype=INDEX_DTYPE)
+        else:
+            self._index = self.build_index(self._records)
+
+    @staticmethod
+    def load(path, dtype):
+        """
+        Отображение файла с записями фиксированной длины в память.
+
+        :param path: путь к файлу
+        :param dtype: numpy.dtype записей
+        :return: numpy.memmap или пустой numpy.ndarray
+        """
+        if os.path.getsize(path):
+            return np.memmap(path, dtype=dtype, mode='r')
+        return np.zeros(0, dtype=dtype)
+
+    @staticmethod
+    def build_index(records):
+        """
+        Построение индекса шагов по номерам шагов в записях.
+
+        :param records: numpy.ndarray с записями RECORD_DTYPE
+        :return: numpy.ndarray с записями INDEX_DTYPE
+        """
+        ticks = records['tick']
+        starts = np.flatnonzero(np.r_[True, ticks[1:] != ticks[:-1]]) if len(ticks) else np.zeros(0, dtype=int)
+        index = np.zeros(len(starts), dtype=INDEX_DTYPE)
+        index['tick'] = ticks[starts]
+        index['start'] = starts
+        return index
+
+    @property
+    def records(self):
+        return self._records
+
+    @property
+    def teams(self):
+        return self._meta['teams']
+
+    @property
+    def team_name(self):
+        return self._meta['team_name']
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @property
+    def ticks(self):
+        """
+        Номера записанных шагов игры.
+
+        :return: numpy.ndarray
+        """
+        return self._index['tick']
+
+    def get_tick(self, tick):
+        """
+        Записи объектов на шаге игры.
+
+        :param tick: номер шага игры
+        :return: numpy.memmap со срезом записей
+        """
+        ticks = self.ticks
+        number = int(np.searchsorted(ticks, tick))
+        if number >= len(ticks) or ticks[number] != tick:
+            raise KeyError(tick)
+        return self.get_by_number(number)
+
+    def get_by_number(self, number):
+        """
+        Записи объектов на шаге игры с порядковым номером в записи.
+
+        :param number: int
+        :return: numpy.memmap со срезом записей
+        """
+        start = int(self._index['start'][number])
+        end = int(self._index['start'][number + 1]) if number + 1 < len(self._index) else len(self._records)
+        return self._records[start:end]
+
+    def get_starts(self):
+        """
+        Индексы первых записей каждого шага игры.
+
+        :return: numpy.ndarray
+        """
+        return self._index['start']
+
+    def __iter__(self):
+        for number, tick in enumerate(self.ticks):
+            yield int(tick), self.get_by_number(number)
+
+    def get_team_name(self, team_id):
+        """
+        Имя команды по номеру.
+
+        :param team_id: int
+        :return: str or None
+        """
+        return None if team_id == NO_TEAM else self.teams[team_id]
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+
+class Record:
+    """
+    Базовый класс компактной записи с фиксированным набором полей в __slots__.
+
+    Для совместимости со словарями поддерживает доступ по ключу:
+    record['team_name'], record.get('team_name'), 'team_name' in record.
+    """
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for field in self.__slots__:
+            setattr(self, field, kwargs.get(field))
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join('{}={!r}'.format(field, getattr(self, field)) for field in self.__slots__)
+        )
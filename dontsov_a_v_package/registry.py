@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+
+class CommandCenterRegistry:
+    """
+    Командные центры, по одному на команду в каждой игре.
+
+    Центры хранятся по ключу (игровое поле, имя команды), поэтому две команды одного класса
+    дронов или несколько игр подряд в одном процессе не делят состояние между собой.
+    По окончании игры ее центры нужно освободить через release.
+    """
+    def __init__(self):
+        self._centers = {}
+
+    def __len__(self):
+        return len(self._centers)
+
+    def __contains__(self, key):
+        return key in self._centers
+
+    def get(self, scene, team, create=None):
+        """
+        Получение командного центра команды, при отсутствии он создается функцией create.
+
+        :param scene: игровое поле
+        :param team: имя команды
+        :param create: функция без параметров, возвращающая CommandCenter
+        :return: CommandCenter or None
+        """
+        key = (scene, team)
+        command_center = self._centers.get(key)
+        if command_center is None and create is not None:
+            command_center = self._centers[key] = create()
+        return command_center
+
+    def get_centers(self, scene):
+        """
+        Командные центры всех команд игрового поля.
+
+        :param scene: игровое поле
+        :return: List
+        """
+        return [command_center for (center_scene, _), command_center in self._centers.items() if center_scene is scene]
+
+    def release(self, scene, team=None):
+        """
+        Освобождение командных центров игрового поля или одной его команды.
+
+        :param scene: игровое поле
+        :param team: имя команды или None для всех команд поля
+        :return: количество освобожденных центров
+        """
+        keys = [
+            key for key in self._centers
+            if key[0] is scene and (team is None or key[1] == team)
+        ]
+        for key in keys:
+            self._centers.pop(key).teardown()
+        return len(keys)
+
+    def clear(self):
+        """
+        Освобождение всех командных центров.
+        """
+        for command_center in self._centers.values():
+            command_center.teardown()
+        self._centers = {}
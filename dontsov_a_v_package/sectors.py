@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from robogame_engine.geometry import Point
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH
+from .records import Record
+from .spatial_index import get_coord
+
+
+class Sector(Record):
+    """
+    Параметры сектора поля.
+
+    Поддерживает доступ по ключу, как у словаря: sector['mothership'], sector.get('team_name').
+    """
+    __slots__ = ('index', 'front', 'home_sector', 'team_name', 'mothership', 'coord')
+
+
+class SectorGeometry:
+    """
+    Геометрия четырех секторов поля, рассчитывается один раз.
+
+    Сектор точки определяется арифметически по половинам ширины и высоты поля:
+    index = 2 * (x >= width / 2) + (y >= height / 2).
+    """
+    def __init__(self, width=FIELD_WIDTH, height=FIELD_HEIGHT):
+        self._half_width = width / 2
+        self._half_height = height / 2
+        center = Point(int(width / 2), int(height / 2))
+        self._corners = [
+            [
+                Point(0, 0),
+                Point(width / 2, 0),
+                center,
+                Point(0, height / 2)
+            ],
+            [
+                Point(0, height / 2),
+                center,
+                Point(width / 2, height),
+                Point(0, height)
+            ],
+            [
+                Point(width / 2, 0),
+                Point(width, 0),
+                Point(width, height / 2),
+                center
+            ],
+            [
+                center,
+                Point(width, height / 2),
+                Point(width, height),
+                Point(width / 2, height)
+            ]
+        ]
+        self._bounds = [
+            (
+                min(point.x for point in corners),
+                min(point.y for point in corners),
+                max(point.x for point in corners),
+                max(point.y for point in corners),
+            )
+            for corners in self._corners
+        ]
+
+    @property
+    def corners(self):
+        """
+        Список секторов с координатами углов.
+
+        :return: List
+        """
+        return self._corners
+
+    @property
+    def bounds(self):
+        """
+        Список границ секторов (min_x, min_y, max_x, max_y).
+
+        :return: List
+        """
+        return self._bounds
+
+    def __len__(self):
+        return len(self._corners)
+
+    def get_index(self, obj):
+        """
+        Получение индекса сектора, в котором находится объект игры или точка.
+
+        :param obj: объект игры или точка
+        :return: int
+        """
+        coord = get_coord(obj)
+        return 2 * (coord.x >= self._half_width) + (coord.y >= self._half_height)
+
+    def is_inside(self, index, obj):
+        """
+        Проверка нахождения объекта игры или точки в границах сектора.
+
+        :param index: int
+        :param obj: объект игры или точка
+        :return: True or False
+        """
+        coord = get_coord(obj)
+        min_x, min_y, max_x, max_y = self._bounds[index]
+        return min_x <= coord.x <= max_x and min_y <= coord.y <= max_y
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+from .query import ObjectQuery, is_alive, is_standing
+from .spatial_index import ENEMY_DRONES
+
+
+def get_game_tick(space_field):
+    """
+    Получение номера текущего шага игры.
+
+    :param space_field: SpaceField
+    :return: int or None
+    """
+    return getattr(space_field, '_step', None)
+
+
+class WorldSnapshot:
+    """
+    Срез состояния мира на один шаг игры.
+
+    Отфильтрованные списки объектов строятся лениво при первом обращении
+    и переиспользуются всеми событиями и действиями до смены шага.
+    Выборки дронов по набору предикатов запоминаются по этому набору.
+    """
+    def __init__(self, command_center, tick):
+        self._nav = command_center
+        self._tick = tick
+        self._drones = None
+        self._views = {}
+        self._game_data = None
+        self._is_spatial_index_actual = False
+        self._is_threat_raster_actual = False
+
+    @property
+    def nav(self):
+        return self._nav
+
+    @property
+    def tick(self):
+        return self._tick
+
+    def is_actual(self, tick):
+        """
+        Проверка соответствия среза текущему шагу игры.
+
+        :param tick: int or None
+        :return: True or False
+        """
+        return tick is not None and tick == self._tick
+
+    @property
+    def drones(self):
+        """
+        Все дроны на поле.
+
+        :return: List
+        """
+        if self._drones is None:
+            self._drones = [drone for teammates in self.nav.space_field.teams.values() for drone in teammates]
+        return self._drones
+
+    def query_drones(self, *predicates):
+        """
+        Ленивый запрос к дронам на поле.
+
+        :param predicates: функции obj -> True or False
+        :return: ObjectQuery
+        """
+        return ObjectQuery(objects=self.drones, predicates=predicates)
+
+    def get_view(self, *predicates):
+        """
+        Список дронов, прошедших все предикаты, запомненный на текущий шаг.
+
+        Возвращаемый список общий для всех вызовов с тем же набором предикатов, его нельзя изменять.
+
+        :param predicates: функции obj -> True or False
+        :return: List
+        """
+        view = self._views.get(predicates)
+        if view is None:
+            view = self._views[predicates] = self.query_drones(*predicates).to_list()
+        return view
+
+    @property
+    def enemy_drones_alive(self):
+        """
+        Живые вражеские дроны.
+
+        :return: List
+        """
+        return self.get_view(self.nav.is_enemy_drone, is_alive)
+
+    @property
+    def team_drones_alive(self):
+        """
+        Живые дружеские дроны.
+
+        :return: List
+        """
+        return self.get_view(self.nav.is_team_drone, is_alive)
+
+    @property
+    def objects_with_loot(self):
+        """
+        Объекты игры с элириумом: астероиды, погибшие дроны и базы противников.
+
+        :return: tuple
+        """
+        return self.nav.loot_index.objects_with_loot
+
+    @property
+    def loot_by_sector(self):
+        """
+        Объекты игры с элириумом, разложенные по индексам секторов.
+
+        :return: tuple с tuple объектов для каждого сектора
+        """
+        return self.nav.loot_index.loot_by_sector
+
+    @property
+    def spatial_index(self):
+        """
+        Пространственная сетка, слой живых вражеских дронов которой перестроен на текущий шаг.
+
+        :return: SpatialGrid
+        """
+        grid = self.nav.spatial_index
+        if not self._is_spatial_index_actual:
+            grid.build(layer=ENEMY_DRONES, objects=self.enemy_drones_alive)
+            self._is_spatial_index_actual = True
+        return grid
+
+    @property
+    def threat_raster(self):
+        """
+        Растр зон поражения неподвижных вражеских дронов на текущий шаг.
+
+        :return: ThreatRaster
+        """
+        raster = self.nav.threat_raster
+        if not self._is_threat_raster_actual:
+            raster.build(drones=self.get_view(self.nav.is_enemy_drone, is_alive, is_standing))
+            self._is_threat_raster_actual = True
+        return raster
+
+    @property
+    def team_stats(self):
+        """
+        Хранилище состояния армий, обновленное на текущий шаг.
+
+        :return: TeamStatsStore
+        """
+        if self._game_data is None:
+            self._game_data = self.nav.build_game_data()
+        return self.nav.team_stats
+
+    @property
+    def game_data(self):
+        """
+        Состояние армий всех команд.
+
+        :return: List
+        """
+        if self._game_data is None:
+            self._game_data = self.nav.build_game_data()
+        return self._game_data
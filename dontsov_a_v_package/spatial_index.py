@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH, RADIUS_ATTACK
+
+ENEMY_DRONES = 'enemy_drones'
+
+
+def get_coord(obj):
+    """
+    Получение координат объекта игры или точки.
+
+    :param obj: объект игры или точка
+    :return: Point
+    """
+    return getattr(obj, 'coord', obj)
+
+
+class SpatialGrid:
+    """
+    Равномерная сетка над игровым полем для поиска объектов в радиусе.
+
+    Объекты хранятся по слоям, каждый слой можно перестроить отдельно от остальных.
+    Сейчас строится только слой живых вражеских дронов - других объектов
+    в запросах по радиусу нет.
+    """
+    def __init__(self, cell_size=RADIUS_ATTACK, width=FIELD_WIDTH, height=FIELD_HEIGHT):
+        self._cell_size = float(cell_size)
+        self._columns = max(int(math.ceil(width / self._cell_size)), 1)
+        self._rows = max(int(math.ceil(height / self._cell_size)), 1)
+        self._layers = {}
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    def get_cell(self, x, y):
+        """
+        Получение ячейки сетки по координатам.
+
+        :param x: float
+        :param y: float
+        :return: tuple
+        """
+        column = min(max(int(x // self._cell_size), 0), self._columns - 1)
+        row = min(max(int(y // self._cell_size), 0), self._rows - 1)
+        return column, row
+
+    def build(self, layer, objects):
+        """
+        Перестроение слоя сетки.
+
+        :param layer: str
+        :param objects: Список объектов игры
+        """
+        cells = self._layers[layer] = {}
+        for obj in objects:
+            coord = get_coord(obj)
+            cells.setdefault(self.get_cell(coord.x, coord.y), []).append(obj)
+
+    def candidates(self, point, radius, layer):
+        """
+        Объекты слоя из ячеек, пересекающих квадрат со стороной 2 * radius вокруг точки.
+
+        :param point: объект игры или точка
+        :param radius: float
+        :param layer: str
+        :return: Generator
+        """
+        cells = self._layers.get(layer)
+        if not cells:
+            return
+        coord = get_coord(point)
+        min_column, min_row = self.get_cell(coord.x - radius, coord.y - radius)
+        max_column, max_row = self.get_cell(coord.x + radius, coord.y + radius)
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                objects = cells.get((column, row))
+                if objects:
+                    yield from objects
+
+    def query(self, point, radius, layer):
+        """
+        Объекты слоя, центры которых находятся не дальше radius от точки.
+
+        :param point: объект игры или точка
+        :param radius: float
+        :param layer: str
+        :return: List
+        """
+        coord = get_coord(point)
+        result = []
+        for obj in self.candidates(point=coord, radius=radius, layer=layer):
+            obj_coord = get_coord(obj)
+            if math.hypot(obj_coord.x - coord.x, obj_coord.y - coord.y) <= radius:
+                result.append(obj)
+        return result
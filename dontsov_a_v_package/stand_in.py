@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+
+import math
+import random
+
+from robogame_engine.geometry import Point, Vector
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH, RADIUS_ATTACK
+
+DRONE_RADIUS = 44
+DRONE_CAPACITY = 100
+DRONE_HEALTH = 100
+MOTHERSHIP_RADIUS = 75
+MOTHERSHIP_OFFSET = 90
+ASTEROID_RADIUS = 50
+TEAM_NAME = 'DontsovDrone'
+
+
+class StandInField:
+    """
+    Поле объекта-заменителя с чтением и записью.
+
+    Перекрывает одноименные свойства классов движка, если заменитель наследуется от них.
+    """
+    def __init__(self, default=None):
+        self._default = default
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = '_stand_in_' + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self._name, self._default)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._name] = value
+
+
+class StandInObject:
+    """
+    Заменитель объекта игры с координатами и элириумом.
+    """
+    _last_id = 0
+
+    coord = StandInField()
+    radius = StandInField(default=0)
+    payload = StandInField(default=0)
+    capacity = StandInField(default=0)
+    health = StandInField(default=DRONE_HEALTH)
+    team = StandInField()
+    id = StandInField()
+
+    def __init__(self, coord, radius=0, payload=0, capacity=0, team=None):
+        StandInObject._last_id += 1
+        self.id = StandInObject._last_id
+        self.coord = coord
+        self.radius = radius
+        self.payload = payload
+        self.capacity = capacity
+        self.team = team
+
+    @property
+    def x(self):
+        return self.coord.x
+
+    @property
+    def y(self):
+        return self.coord.y
+
+    @property
+    def is_alive(self):
+        return self.health > 0
+
+    @property
+    def is_empty(self):
+        return self.payload == 0
+
+    @property
+    def is_full(self):
+        return self.payload >= self.capacity
+
+    @property
+    def free_space(self):
+        return self.capacity - self.payload
+
+    def distance_to(self, obj):
+        coord = getattr(obj, 'coord', obj)
+        return self.coord.distance_to(coord)
+
+    def near(self, obj):
+        return self.distance_to(obj) <= self.radius
+
+    def __repr__(self):
+        return '{}(id={}, x={:.0f}, y={:.0f})'.format(self.__class__.__name__, self.id, self.x, self.y)
+
+
+class StandInAsteroid(StandInObject):
+    """
+    Заменитель астероида.
+    """
+    def __init__(self, coord, payload):
+        super().__init__(coord=coord, radius=ASTEROID_RADIUS, payload=payload, capacity=payload)
+
+
+class StandInMothership(StandInObject):
+    """
+    Заменитель базы команды.
+    """
+    def __init__(self, coord, team, payload=0):
+        super().__init__(coord=coord, radius=MOTHERSHIP_RADIUS, payload=payload, capacity=10 ** 6, team=team)
+
+
+class StandInGun:
+    """
+    Заменитель оружия дрона, запоминающий выстрелы.
+    """
+    def __init__(self, drone):
+        self.drone = drone
+        self.shot_distance = RADIUS_ATTACK
+        self.projectile = StandInObject(coord=Point(0, 0), radius=3)
+
+    def shot(self, target):
+        self.drone.commands.append(('shot', target))
+
+
+class StandInDroneMixin(StandInObject):
+    """
+    Заменитель дрона, который вместо движка запоминает отданные ему команды.
+    """
+    is_moving = StandInField(default=False)
+    vector = StandInField()
+    direction = StandInField(default=0)
+    my_mothership = StandInField()
+    scene = StandInField()
+    gun = StandInField()
+    set_team_name = StandInField()
+
+    def __init__(self, scene, mothership, coord, team, payload=0, is_moving=False, direction=0):
+        StandInObject.__init__(
+            self, coord=coord, radius=DRONE_RADIUS, payload=payload, capacity=DRONE_CAPACITY, team=team)
+        self.scene = scene
+        self.my_mothership = mothership
+        self.set_team_name = team
+        self.is_moving = is_moving
+        self.direction = direction
+        self.vector = Vector.from_direction(direction=direction, module=1)
+        self.gun = StandInGun(drone=self)
+        self.commands = []
+        self.strategy = None
+        self.target_attack = None
+        self.start_position = None
+        self.target_move = None
+
+    @property
+    def teammates(self):
+        return [drone for drone in self.scene.teams[self.team] if drone is not self and drone.is_alive]
+
+    def move_at(self, target):
+        self.commands.append(('move_at', target))
+
+    def turn_to(self, target):
+        self.commands.append(('turn_to', target))
+
+    def load_from(self, source):
+        self.commands.append(('load_from', source))
+
+    def unload_to(self, target):
+        self.commands.append(('unload_to', target))
+
+
+class StandInDrone(StandInDroneMixin):
+    """
+    Заменитель вражеского дрона.
+    """
+
+
+def get_team_drone_class():
+    """
+    Класс заменителя дружеского дрона, наследника DontsovDrone.
+
+    :return: класс дрона
+    """
+    global _team_drone_class
+    if _team_drone_class is None:
+        from hangar_2021.dontsov_a_v import DontsovDrone
+        _team_drone_class = type('StandInDontsovDrone', (StandInDroneMixin, DontsovDrone), {})
+    return _team_drone_class
+
+
+_team_drone_class = None
+
+
+class StandInSpaceField:
+    """
+    Заменитель игрового поля со счетчиком шагов.
+    """
+    def __init__(self):
+        self._step = 0
+        self.teams = {}
+        self.asteroids = []
+        self.motherships = []
+
+    def step(self):
+        """
+        Переход на следующий шаг игры.
+        """
+        self._step += 1
+
+
+class StandInWorld:
+    """
+    Генератор синтетических сцен для запуска CommandCenter без движка игры.
+    """
+    mothership_positions = [
+        Point(MOTHERSHIP_OFFSET, MOTHERSHIP_OFFSET),
+        Point(FIELD_WIDTH - MOTHERSHIP_OFFSET, FIELD_HEIGHT - MOTHERSHIP_OFFSET),
+        Point(MOTHERSHIP_OFFSET, FIELD_HEIGHT - MOTHERSHIP_OFFSET),
+        Point(FIELD_WIDTH - MOTHERSHIP_OFFSET, MOTHERSHIP_OFFSET),
+    ]
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+        self.space_field = StandInSpaceField()
+        self.command_center = None
+
+    @property
+    def team_drones(self):
+        return self.space_field.teams.get(TEAM_NAME, [])
+
+    def random_point(self, margin=MOTHERSHIP_OFFSET):
+        return Point(
+            self.random.uniform(margin, FIELD_WIDTH - margin),
+            self.random.uniform(margin, FIELD_HEIGHT - margin),
+        )
+
+    def random_point_near(self, point, distance):
+        direction = self.random.uniform(0, 360)
+        module = self.random.uniform(0, distance)
+        radian = math.radians(direction)
+        x = min(max(point.x + module * math.cos(radian), 0), FIELD_WIDTH)
+        y = min(max(point.y + module * math.sin(radian), 0), FIELD_HEIGHT)
+        return Point(x, y)
+
+    def add_asteroid(self, coord=None, payload=None):
+        asteroid = StandInAsteroid(
+            coord=self.random_point() if coord is None else coord,
+            payload=self.random.randint(50, 300) if payload is None else payload,
+        )
+        self.space_field.asteroids.append(asteroid)
+        return asteroid
+
+    def add_mothership(self, team, coord=None, payload=0):
+        mothership = StandInMothership(
+            coord=self.mothership_positions[len(self.space_field.motherships)] if coord is None else coord,
+            team=team,
+            payload=payload,
+        )
+        self.space_field.motherships.append(mothership)
+        self.space_field.teams.setdefault(team, [])
+        return mothership
+
+    def add_drone(self, team, coord=None, **kwargs):
+        mothership = next(mship for mship in self.space_field.motherships if mship.team == team)
+        drone_class = get_team_drone_class() if team == TEAM_NAME else StandInDrone
+        drone = drone_class(
+            scene=self.space_field,
+            mothership=mothership,
+            coord=self.random_point_near(mothership.coord, distance=3 * MOTHERSHIP_RADIUS) if coord is None else coord,
+            team=team,
+            **kwargs
+        )
+        self.space_field.teams[team].append(drone)
+        return drone
+
+    def start(self):
+        """
+        Создание командного центра и назначение стартовых стратегий дружеским дронам.
+
+        :return: CommandCenter
+        """
+        from hangar_2021.dontsov_a_v import CommandCenter
+        team_drones = self.team_drones
+        self.command_center = CommandCenter(
+            my_mothership=team_drones[0].my_mothership,
+            space_field=self.space_field,
+        )
+        for drone in team_drones:
+            drone.command_center = self.command_center
+            self.command_center.run(drone=drone)
+        return self.command_center
+
+    def step(self):
+        """
+        Переход на следующий шаг игры.
+        """
+        self.space_field.step()
+
+
+def make_scene(drones_per_team=5, teams_count=4, asteroids_count=10, seed=0,
+               moving_share=.5, dead_share=.1, loaded_share=.3):
+    """
+    Создание синтетической сцены с заданным количеством объектов.
+
+    :param drones_per_team: int
+    :param teams_count: int, от 1 до 4, первая команда - DontsovDrone
+    :param asteroids_count: int
+    :param seed: int
+    :param moving_share: доля движущихся вражеских дронов
+    :param dead_share: доля погибших дронов
+    :param loaded_share: доля дронов с элириумом
+    :return: StandInWorld
+    """
+    world = StandInWorld(seed=seed)
+    rnd = world.random
+    teams = [TEAM_NAME] + ['EnemyDrone{}'.format(number) for number in range(1, teams_count)]
+    for team in teams:
+        world.add_mothership(team=team, payload=rnd.randint(0, 500))
+    for _ in range(asteroids_count):
+        world.add_asteroid()
+    for team in teams:
+        for _ in range(drones_per_team):
+            is_enemy = team != TEAM_NAME
+            drone = world.add_drone(
+                team=team,
+                coord=world.random_point(margin=0) if is_enemy and rnd.random() < .5 else None,
+                payload=rnd.randint(10, DRONE_CAPACITY) if rnd.random() < loaded_share else 0,
+                is_moving=is_enemy and rnd.random() < moving_share,
+                direction=rnd.uniform(0, 360),
+            )
+            if rnd.random() < dead_share:
+                drone.health = 0
+    world.start()
+    return world
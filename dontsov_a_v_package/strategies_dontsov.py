@@ -10,6 +10,9 @@ class BaseStrategy:
     """
     Базовый класс стратегии.
     """
+    __slots__ = ('_drone', 'recovery_action', 'unload_action', 'move_action', 'current_action')
+    action_names = ('recovery_action', 'unload_action', 'move_action')
+
     def __init__(self, **kwargs):
         self._drone = kwargs['drone']
         self.recovery_action = MoveRecoveryAction(**kwargs)
@@ -33,6 +36,23 @@ class BaseStrategy:
         """
         pass
 
+    @property
+    def actions(self):
+        """
+        Действия стратегии.
+
+        :return: List
+        """
+        return [getattr(self, name) for name in self.action_names]
+
+    def reset(self, **kwargs):
+        """
+        Сброс стратегии к начальному состоянию с новыми параметрами, как при создании.
+        """
+        for action in self.actions:
+            action.reset(drone=self.drone, **kwargs)
+        self.current_action = self.move_action
+
 
 class DefenderStrategy(BaseStrategy):
     """
@@ -40,6 +60,9 @@ class DefenderStrategy(BaseStrategy):
 
     :return: Dict
     """
+    __slots__ = ('attack_action',)
+    action_names = BaseStrategy.action_names + ('attack_action',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.move_action = MoveDefenderAction(**kwargs)
@@ -51,6 +74,9 @@ class HarvestStrategy(BaseStrategy):
     """
     Стратегия защиты базы.
     """
+    __slots__ = ('load_action',)
+    action_names = BaseStrategy.action_names + ('load_action',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.move_action = MoveHarvestAction(**kwargs)
@@ -71,6 +97,9 @@ class SabotageStrategy(BaseStrategy):
     """
     Стратегия вторжения в сектор по безопасной траектории.
     """
+    __slots__ = ('attack_action',)
+    action_names = BaseStrategy.action_names + ('attack_action',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.move_action = MoveToSector(**kwargs)
@@ -91,6 +120,9 @@ class LastBattleStrategy(BaseStrategy):
     """
     Стратегия нападения в центральный сектор.
     """
+    __slots__ = ('attack_action',)
+    action_names = BaseStrategy.action_names + ('attack_action',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.move_action = MoveLastSectorAction(**kwargs)
@@ -102,3 +134,39 @@ class LastBattleStrategy(BaseStrategy):
          Обновление атрибутов стратегии.
         """
         self.move_action.sector = kwargs.get('sector')
+
+
+class StrategyPool:
+    """
+    Набор созданных стратегий одного дрона для повторного использования.
+
+    При переходе в стратегию, которая уже создавалась для дрона, она не создается заново,
+    а сбрасывается к начальному состоянию с новыми параметрами.
+    """
+    def __init__(self, drone):
+        self._drone = drone
+        self._strategies = {}
+
+    @property
+    def drone(self):
+        return self._drone
+
+    def get(self, strategy, **kwargs):
+        """
+        Получение стратегии в начальном состоянии с заданными параметрами.
+
+        :param strategy: класс стратегии
+        :return: BaseStrategy
+        """
+        instance = self._strategies.get(strategy)
+        if instance is None:
+            instance = self._strategies[strategy] = strategy(drone=self.drone, **kwargs)
+        else:
+            instance.reset(**kwargs)
+        return instance
+
+    def clear(self):
+        """
+        Удаление всех созданных стратегий.
+        """
+        self._strategies.clear()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+from .records import Record
+
+
+class TeamStats(Record):
+    """
+    Состояние армии одной команды.
+
+    Поддерживает доступ по ключу, как у словаря: team['number_soldiers'], team.get('team_name').
+    """
+    __slots__ = ('team_name', 'number_soldiers', 'elirium', 'defenders')
+
+    def __init__(self, team_name):
+        super().__init__(team_name=team_name, number_soldiers=0, elirium=0, defenders=0)
+
+
+class TeamStatsStore:
+    """
+    Хранилище состояния армий команд с инкрементальным обновлением.
+
+    Для каждого дрона и базы запоминается их последний вклад в статистику команды,
+    при изменении состояния объекта старый вклад вычитается, а новый добавляется.
+    Объекты перепроверяются только по событиям: после загрузки и выгрузки, при гибели
+    и раз в интервал heartbeat для дронов и баз противников, о грузе которых события не приходят.
+    Защитники баз зависят от положения дронов, их количество задается на шаг снаружи.
+    """
+    def __init__(self):
+        self._teams = {}
+        self._motherships = {}
+        self._drones_contribution = {}
+        self._motherships_contribution = {}
+
+    @property
+    def motherships(self):
+        """
+        Базы команд по названию команды.
+
+        :return: Dict
+        """
+        return self._motherships
+
+    def get(self, team_name):
+        """
+        Получение состояния армии команды.
+
+        :param team_name: str
+        :return: TeamStats or None
+        """
+        return self._teams.get(team_name)
+
+    def values(self):
+        """
+        Состояния армий всех команд в порядке их регистрации.
+
+        :return: List
+        """
+        return list(self._teams.values())
+
+    def get_or_create(self, team_name):
+        """
+        Получение или регистрация состояния армии команды.
+
+        :param team_name: str
+        :return: TeamStats
+        """
+        team = self._teams.get(team_name)
+        if team is None:
+            team = self._teams[team_name] = TeamStats(team_name=team_name)
+        return team
+
+    def register(self, drones, motherships):
+        """
+        Учет всех дронов и баз на поле, вызывается при появлении новых объектов.
+
+        :param drones: Список дронов
+        :param motherships: Список баз
+        """
+        for mship in motherships:
+            self._motherships.setdefault(mship.team, mship)
+        for drone in drones:
+            self.update_drone(drone)
+        for mship in motherships:
+            self.update_mothership(mship)
+
+    def update(self, obj):
+        """
+        Учет изменения состояния дрона или базы.
+
+        :param obj: Drone or MotherShip
+        """
+        if obj in self._motherships_contribution:
+            self.update_mothership(obj)
+        else:
+            self.update_drone(obj)
+
+    def update_drone(self, drone):
+        """
+        Учет изменения состояния дрона.
+
+        :param drone: Drone
+        """
+        team = self.get_or_create(drone.set_team_name)
+        contribution = (1, drone.payload) if drone.is_alive else (0, 0)
+        old_contribution = self._drones_contribution.get(drone, (0, 0))
+        if contribution != old_contribution:
+            team.number_soldiers += contribution[0] - old_contribution[0]
+            team.elirium += contribution[1] - old_contribution[1]
+            self._drones_contribution[drone] = contribution
+
+    def update_mothership(self, mship):
+        """
+        Учет изменения состояния базы.
+
+        :param mship: MotherShip
+        """
+        if mship.is_alive:
+            team = self.get_or_create(mship.team)
+            contribution = mship.payload
+        else:
+            team = self._teams.get(mship.team)
+            contribution = 0
+
+        old_contribution = self._motherships_contribution.get(mship, 0)
+        if team is not None and contribution != old_contribution:
+            team.elirium += contribution - old_contribution
+        self._motherships_contribution[mship] = contribution
+
+    def set_defenders(self, team_name, defenders):
+        """
+        Количество дронов команды в зоне лечения у своей базы.
+
+        :param team_name: str
+        :param defenders: int
+        """
+        self.get_or_create(team_name).defenders = defenders
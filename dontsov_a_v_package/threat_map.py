@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+import numpy as np
+
+from .constants import FIELD_HEIGHT, FIELD_WIDTH, RADIUS_ATTACK
+from .spatial_index import get_coord
+
+THREAT_RASTER_RESOLUTION = 10
+
+
+class ThreatRaster:
+    """
+    Растр зон поражения неподвижных вражеских дронов.
+
+    Ячейка растра опасна, если ее центр находится ближе радиуса атаки к одному из дронов.
+    Растр перестраивается только при изменении позиций стреляющих дронов.
+    """
+    def __init__(self, resolution=THREAT_RASTER_RESOLUTION, radius=RADIUS_ATTACK,
+                 width=FIELD_WIDTH, height=FIELD_HEIGHT):
+        self._resolution = float(resolution)
+        self._radius = float(radius)
+        columns = max(int(math.ceil(width / self._resolution)), 1)
+        rows = max(int(math.ceil(height / self._resolution)), 1)
+        self._xs = (np.arange(columns) + .5) * self._resolution
+        self._ys = (np.arange(rows) + .5) * self._resolution
+        self._danger = np.zeros((rows, columns), dtype=bool)
+        self._positions = None
+        self._version = 0
+
+    @property
+    def version(self):
+        """
+        Номер версии растра, увеличивается при каждом перестроении.
+
+        :return: int
+        """
+        return self._version
+
+    @property
+    def danger(self):
+        return self._danger
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def build(self, drones):
+        """
+        Перестроение растра по позициям стреляющих дронов.
+
+        :param drones: Список неподвижных вражеских дронов
+        """
+        positions = np.array([(drone.coord.x, drone.coord.y) for drone in drones], dtype=float).reshape(-1, 2)
+        if self._positions is not None and np.array_equal(positions, self._positions):
+            return
+        self._positions = positions
+        self._version += 1
+        self._danger[:] = False
+        radius_square = self._radius ** 2
+        for x, y in positions:
+            min_column, max_column = self.get_index_range(x, self._xs.size)
+            min_row, max_row = self.get_index_range(y, self._ys.size)
+            dx_square = (self._xs[min_column:max_column] - x) ** 2
+            dy_square = (self._ys[min_row:max_row] - y) ** 2
+            self._danger[min_row:max_row, min_column:max_column] |= \
+                dy_square[:, None] + dx_square[None, :] < radius_square
+
+    def get_index_range(self, coord, size):
+        """
+        Диапазон индексов ячеек, которые может накрыть зона поражения.
+
+        :param coord: float
+        :param size: int
+        :return: tuple
+        """
+        start = int((coord - self._radius) // self._resolution)
+        end = int((coord + self._radius) // self._resolution) + 1
+        return min(max(start, 0), size), min(max(end, 0), size)
+
+    def is_safe(self, obj):
+        """
+        Проверка нахождения точки или объекта игры вне зоны поражения.
+
+        :param obj: объект игры или точка
+        :return: True or False
+        """
+        coord = get_coord(obj)
+        row = min(max(int(coord.y // self._resolution), 0), self._ys.size - 1)
+        column = min(max(int(coord.x // self._resolution), 0), self._xs.size - 1)
+        return not self._danger[row, column]
+
+    def classify(self, points):
+        """
+        Проверка безопасности набора точек за один вызов.
+
+        :param points: Список точек или объектов игры, либо массив координат формы (N, 2)
+        :return: numpy.ndarray с True для безопасных точек
+        """
+        if isinstance(points, np.ndarray):
+            coords = points.reshape(-1, 2)
+        else:
+            coords = np.array(
+                [(coord.x, coord.y) for coord in map(get_coord, points)], dtype=float
+            ).reshape(-1, 2)
+        columns = np.clip((coords[:, 0] // self._resolution).astype(int), 0, self._xs.size - 1)
+        rows = np.clip((coords[:, 1] // self._resolution).astype(int), 0, self._ys.size - 1)
+        return ~self._danger[rows, columns]
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# python runner.py --seed 1 --record game.bin
+# python replay.py game.bin --runs 2
+
+import argparse
+import json
+import sys
+import time
+
+from robogame_engine.geometry import Point, Vector
+
+from hangar_2021.dontsov_a_v_package import WorldRecording
+from hangar_2021.dontsov_a_v_package.recorder import KIND_ASTEROID, KIND_DRONE, KIND_MOTHERSHIP
+from hangar_2021.dontsov_a_v_package.stand_in import TEAM_NAME, StandInWorld
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def get_team(recording, team_id):
+    """
+    Имя команды заменителя по номеру команды в записи, записавшая команда получает имя дружеской.
+
+    :param recording: WorldRecording
+    :param team_id: int
+    :return: str or None
+    """
+    team = recording.get_team_name(team_id)
+    return TEAM_NAME if team is not None and team == recording.team_name else team
+
+
+def build_world(recording, records):
+    """
+    Создание заменителей объектов игры по записям первого шага.
+
+    :param recording: WorldRecording
+    :param records: записи шага
+    :return: tuple (StandInWorld, Dict номер объекта -> заменитель)
+    """
+    world = StandInWorld()
+    objects = {}
+    for record in records[records['kind'] == KIND_MOTHERSHIP]:
+        objects[int(record['id'])] = world.add_mothership(
+            team=get_team(recording=recording, team_id=int(record['team'])),
+            coord=Point(float(record['x']), float(record['y'])),
+        )
+    for record in records[records['kind'] == KIND_ASTEROID]:
+        objects[int(record['id'])] = world.add_asteroid(
+            coord=Point(float(record['x']), float(record['y'])),
+            payload=float(record['payload']),
+        )
+    for record in records[records['kind'] == KIND_DRONE]:
+        objects[int(record['id'])] = world.add_drone(
+            team=get_team(recording=recording, team_id=int(record['team'])),
+            coord=Point(float(record['x']), float(record['y'])),
+        )
+    for number, obj in objects.items():
+        obj.id = number
+    update_world(world=world, objects=objects, records=records)
+    world.start()
+    return world, objects
+
+
+def update_world(world, objects, records):
+    """
+    Перенос состояния объектов игры из записей шага в заменители.
+
+    :param world: StandInWorld
+    :param objects: Dict номер объекта -> заменитель
+    :param records: записи шага
+    """
+    for record in records.tolist():
+        tick, kind, number, _, is_alive, is_moving, x, y, direction, health, payload = record
+        obj = objects.get(number)
+        if obj is None:
+            continue
+        obj.coord = Point(x, y)
+        obj.payload = payload
+        if kind != KIND_ASTEROID:
+            obj.health = health if is_alive else 0
+        if kind == KIND_DRONE:
+            obj.is_moving = is_moving
+            if obj.direction != direction:
+                obj.direction = direction
+                obj.vector = Vector.from_direction(direction=direction, module=1)
+    world.space_field._step = int(records['tick'][0])
+
+
+def describe(value):
+    """
+    Описание решения в виде, пригодном для сравнения между запусками.
+
+    :param value: значение
+    :return: значение из чисел, строк, None и кортежей
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, type):
+        return value.__name__
+    if isinstance(value, Point):
+        return round(value.x, 6), round(value.y, 6)
+    if isinstance(value, dict):
+        return tuple(sorted((key, describe(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(describe(item) for item in value)
+    if hasattr(value, 'index') and hasattr(value, 'mothership'):
+        return 'sector', value.index
+    return type(value).__name__, getattr(value, 'id', None)
+
+
+def replay(recording, limit=None):
+    """
+    Проигрывание записи через CommandCenter без движка игры.
+
+    На каждом шаге замеряется выбор стратегии отряда и выбор действия каждого дружеского дрона.
+
+    :param recording: WorldRecording
+    :param limit: наибольшее количество шагов
+    :return: tuple (Dict с длительностями в секундах, List с решениями по шагам)
+    """
+    latencies = {'get_next_strategy': [], 'drone_decision': [], 'tick': []}
+    decisions = []
+    world = objects = None
+    for number, (tick, records) in enumerate(recording):
+        if limit is not None and number >= limit:
+            break
+        if world is None:
+            world, objects = build_world(recording=recording, records=records)
+        else:
+            update_world(world=world, objects=objects, records=records)
+        nav = world.command_center
+
+        tick_start = time.perf_counter()
+        start = time.perf_counter()
+        plan = nav.get_next_strategy()
+        latencies['get_next_strategy'].append(time.perf_counter() - start)
+
+        tick_decisions = [describe(plan)]
+        for drone in world.team_drones:
+            if not drone.is_alive:
+                continue
+            drone.commands = []
+            start = time.perf_counter()
+            drone.next_action()
+            latencies['drone_decision'].append(time.perf_counter() - start)
+            tick_decisions.append((
+                drone.id,
+                describe(type(drone.strategy)),
+                describe(type(drone.strategy.current_action)),
+                describe(drone.commands),
+            ))
+        latencies['tick'].append(time.perf_counter() - tick_start)
+        decisions.append((tick, tuple(tick_decisions)))
+    return latencies, decisions
+
+
+def get_percentiles(values):
+    """
+    Процентили длительностей в микросекундах.
+
+    :param values: List длительностей в секундах
+    :return: Dict
+    """
+    values = sorted(values)
+    if not values:
+        return {}
+    result = {
+        'p{}'.format(percentile): values[min(int(len(values) * percentile / 100), len(values) - 1)] * 10 ** 6
+        for percentile in PERCENTILES
+    }
+    result['max'] = values[-1] * 10 ** 6
+    result['mean'] = sum(values) / len(values) * 10 ** 6
+    result['count'] = len(values)
+    return result
+
+
+def compare_decisions(first, second):
+    """
+    Шаги, на которых решения двух запусков различаются.
+
+    :param first: List с решениями по шагам
+    :param second: List с решениями по шагам
+    :return: List номеров шагов
+    """
+    mismatches = [tick for (tick, decision), (_, other) in zip(first, second) if decision != other]
+    if len(first) != len(second):
+        mismatches.append(min(len(first), len(second)))
+    return mismatches
+
+
+def run(path, runs=2, limit=None):
+    """
+    Многократное проигрывание записи с проверкой совпадения решений.
+
+    :param path: путь к файлу записи
+    :param runs: количество проигрываний
+    :param limit: наибольшее количество шагов
+    :return: Dict
+    """
+    recording = WorldRecording(path)
+    results = [replay(recording=recording, limit=limit) for _ in range(max(runs, 1))]
+    latencies, decisions = results[-1]
+    mismatches = sorted({tick for _, other in results[:-1] for tick in compare_decisions(other, decisions)})
+    return {
+        'recording': path,
+        'ticks': len(decisions),
+        'runs': len(results),
+        'deterministic': not mismatches,
+        'mismatched_ticks': mismatches[:20],
+        'latency_us': {name: get_percentiles(values) for name, values in latencies.items()},
+    }
+
+
+def print_report(report):
+    print('{}: {} ticks, {} runs, deterministic: {}'.format(
+        report['recording'], report['ticks'], report['runs'], report['deterministic']))
+    if report['mismatched_ticks']:
+        print('mismatched ticks: {}'.format(', '.join(map(str, report['mismatched_ticks']))))
+    columns = ['p{}'.format(percentile) for percentile in PERCENTILES] + ['max', 'mean']
+    print('{:<20} {:>8} '.format('case', 'count') + ' '.join('{:>10}'.format(column) for column in columns))
+    for name, stats in report['latency_us'].items():
+        print('{:<20} {:>8} '.format(name, stats.get('count', 0))
+              + ' '.join('{:>10.1f}'.format(stats.get(column, 0)) for column in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Проигрывание записи игры через CommandCenter без движка.')
+    parser.add_argument('recording', help='файл записи, созданный runner.py --record')
+    parser.add_argument('--runs', type=int, default=2, help='количество проигрываний для проверки повторяемости')
+    parser.add_argument('--limit', type=int, default=None, help='наибольшее количество шагов')
+    parser.add_argument('--json', action='store_true', help='вывод результата в формате JSON')
+    args = parser.parse_args(argv)
+    report = run(path=args.recording, runs=args.runs, limit=args.limit)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
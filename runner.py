@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# python runner.py --seed 42 --drones 5 --asteroids 10 --opponent hangar_2021.some_drone
+# python runner.py --seed 1 --games 20 --opponent hangar_2021.some_drone
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from astrobox.space_field import SpaceField  # noqa: E402
+from robogame_engine.scene import Scene  # noqa: E402
+
+from hangar_2021.dontsov_a_v import CommandCenter, DontsovDrone  # noqa: E402
+from hangar_2021.dontsov_a_v_package import WorldRecorder, profiler  # noqa: E402
+
+NUMBER_OF_DRONES = 5
+NUMBER_OF_ASTEROIDS = 10
+MAX_TICKS = 17000
+
+
+def load_drone_class(path):
+    """
+    Загрузка класса дрона по пути вида 'package.module' или 'package.module:ClassName'.
+
+    Если имя класса не указано, берется атрибут drone_class модуля.
+
+    :param path: str
+    :return: класс дрона
+    """
+    module_name, _, class_name = path.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name or 'drone_class')
+
+
+def reset_teams():
+    """
+    Очистка команд движка перед новой игрой.
+
+    Scene хранит команды в атрибуте класса, общем для всех полей, поэтому без очистки
+    дроны прошлой игры попадают в команды следующей. Публичного способа очистки у движка нет:
+    свойство Scene.teams возвращает копию. Поэтому очищается приватный атрибут Scene.__teams.
+    Если в установленной версии движка его нет, игры в одном процессе перемешали бы команды,
+    поэтому запуск прерывается с ошибкой, а не продолжается молча.
+    """
+    teams = getattr(Scene, '_Scene__teams', None)
+    if teams is None:
+        raise RuntimeError(
+            'в robogame_engine.Scene нет атрибута _Scene__teams, команды между играми не очистить'
+        )
+    # приватный атрибут движка, см. robogame_engine/scene.py: Scene.__teams = OrderedDict()
+    teams.clear()
+
+
+class HeadlessGame:
+    """
+    Игра без отрисовки с фиксированным зерном случайных чисел.
+    """
+    def __init__(self, seed=None, drones_count=NUMBER_OF_DRONES, asteroids_count=NUMBER_OF_ASTEROIDS,
+                 opponents=None, speed=1, max_ticks=MAX_TICKS, can_fight=True, recorder=None):
+        self.seed = seed
+        self.drones_count = drones_count
+        self.asteroids_count = asteroids_count
+        self.opponents = opponents or []
+        self.speed = speed
+        self.max_ticks = max_ticks
+        self.can_fight = can_fight
+        self.recorder = recorder
+        self.scene = None
+        self.ticks_time = []
+
+    def prepare(self):
+        """
+        Создание поля и команд дронов.
+        """
+        if self.seed is not None:
+            random.seed(self.seed)
+        reset_teams()
+        self.scene = SpaceField(
+            speed=self.speed,
+            asteroids_count=self.asteroids_count,
+            can_fight=self.can_fight,
+            headless=True,
+        )
+        team_drones = [DontsovDrone() for _ in range(self.drones_count)]
+        for drone_class in self.opponents:
+            [drone_class() for _ in range(self.drones_count)]
+        self.scene.prepare(**self.scene.init_kwargs)
+        if self.recorder is not None:
+            self.recorder.team_name = team_drones[0].team
+
+    def run(self):
+        """
+        Проведение игры до окончания или до лимита шагов, как в Scene.go, но без интерфейса.
+
+        :return: Dict с результатом игры
+        """
+        self.prepare()
+        self.ticks_time = []
+        game_result = {}
+        while len(self.ticks_time) < self.max_ticks:
+            is_game_over, game_result = self.scene.get_game_result()
+            if is_game_over:
+                break
+            self.scene._step += 1
+            if self.recorder is not None:
+                self.recorder.write_scene(tick=self.scene._step, scene=self.scene)
+            start = time.perf_counter()
+            self.scene.game_step()
+            self.ticks_time.append(time.perf_counter() - start)
+        result = self.get_result(game_result)
+        self.teardown()
+        return result
+
+    def teardown(self):
+        """
+        Освобождение командных центров и команд игры, чтобы следующая игра в процессе начиналась с чистого состояния.
+        """
+        DontsovDrone.command_centers.release(scene=self.scene)
+        reset_teams()
+
+    def get_result(self, game_result):
+        """
+        Результат игры в виде словаря.
+
+        :param game_result: Dict с результатом игры от SpaceField
+        :return: Dict
+        """
+        elirium = game_result.get('collected') or {
+            team: stat['drones'] + stat['base'] for team, stat in self.scene._get_game_state().items()
+            if team != 'countdown'
+        }
+        ticks_time = sorted(self.ticks_time)
+        ticks = len(ticks_time)
+        return {
+            'seed': self.seed,
+            'winner': max(elirium, key=elirium.get) if elirium else None,
+            'elirium': elirium,
+            'dead': game_result.get('dead', {}),
+            'ticks': ticks,
+            'wall_time': sum(ticks_time),
+            'tick_time': {
+                'mean': sum(ticks_time) / ticks if ticks else 0,
+                'p50': ticks_time[ticks // 2] if ticks else 0,
+                'p95': ticks_time[min(int(ticks * .95), ticks - 1)] if ticks else 0,
+                'max': ticks_time[-1] if ticks else 0,
+            },
+        }
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='Запуск игры DontsovDrone без отрисовки.')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--drones', type=int, default=NUMBER_OF_DRONES)
+    parser.add_argument('--asteroids', type=int, default=NUMBER_OF_ASTEROIDS)
+    parser.add_argument('--opponent', action='append', default=[],
+                        help="модуль противника 'package.module' или 'package.module:ClassName'")
+    parser.add_argument('--speed', type=int, default=1)
+    parser.add_argument('--max-ticks', type=int, default=MAX_TICKS)
+    parser.add_argument('--no-fight', action='store_true', help='игра без стрельбы')
+    parser.add_argument('--profile', default=None, help='файл .csv или .json для статистики вызовов')
+    parser.add_argument('--record', default=None, help='файл для записи состояния мира на каждом шаге')
+    parser.add_argument('--games', type=int, default=1,
+                        help='количество игр подряд в одном процессе, зерно каждой следующей игры больше на 1')
+    return parser
+
+
+def get_summary(results):
+    """
+    Сводка по серии игр.
+
+    :param results: Список результатов игр
+    :return: Dict
+    """
+    teams = sorted({team for result in results for team in result['elirium']})
+    wall_time = sum(result['wall_time'] for result in results)
+    ticks = sum(result['ticks'] for result in results)
+    return {
+        'games': len(results),
+        'wins': {team: sum(result['winner'] == team for result in results) for team in teams},
+        'elirium_mean': {
+            team: sum(result['elirium'].get(team, 0) for result in results) / len(results) for team in teams
+        },
+        'ticks': ticks,
+        'wall_time': wall_time,
+        'tick_time_mean': wall_time / ticks if ticks else 0,
+    }
+
+
+def run_games(args, opponents):
+    """
+    Проведение серии игр с параметрами командной строки.
+
+    :param args: argparse.Namespace
+    :param opponents: Список классов дронов противников
+    :return: Список результатов игр
+    """
+    results = []
+    for number in range(max(args.games, 1)):
+        game = HeadlessGame(
+            seed=None if args.seed is None else args.seed + number,
+            drones_count=args.drones,
+            asteroids_count=args.asteroids,
+            opponents=opponents,
+            speed=args.speed,
+            max_ticks=args.max_ticks,
+            can_fight=not args.no_fight,
+            recorder=WorldRecorder(path=args.record) if args.record else None,
+        )
+        if game.recorder is not None:
+            with game.recorder:
+                results.append(game.run())
+        else:
+            results.append(game.run())
+    return results
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    if args.games > 1 and args.record:
+        raise SystemExit('--record записывает одну игру, его нельзя использовать с --games')
+    opponents = [load_drone_class(path) for path in args.opponent]
+    if args.profile:
+        profiler.enable(command_center_class=CommandCenter)
+    # движок печатает рейтинг игры в stdout, поэтому на время игр вывод переводится в stderr,
+    # и в stdout остается только JSON с результатом
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run_games(args=args, opponents=opponents)
+    if len(results) == 1:
+        json.dump(results[0], sys.stdout, indent=2)
+    else:
+        json.dump({'summary': get_summary(results), 'results': results}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    if args.profile:
+        profiler.disable()
+        profiler.export(args.profile)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package.stand_in import StandInWorld, TEAM_NAME, DRONE_RADIUS
+
+ENEMY_TEAM = 'EnemyDrone'
+
+
+def make_world(mates_coords, dead_coords=()):
+    """
+    Сцена со стрелком в (300, 300), его союзниками и одним вражеским дроном.
+    """
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME)
+    world.add_mothership(team=ENEMY_TEAM)
+    world.add_asteroid(coord=Point(600, 600), payload=100)
+    shooter = world.add_drone(team=TEAM_NAME, coord=Point(300, 300))
+    for coord in mates_coords:
+        world.add_drone(team=TEAM_NAME, coord=Point(*coord))
+    for coord in dead_coords:
+        world.add_drone(team=TEAM_NAME, coord=Point(*coord)).health = 0
+    world.add_drone(team=ENEMY_TEAM, coord=Point(700, 300))
+    world.start()
+    return world, shooter
+
+
+def shooter_projectile_radius():
+    _, shooter = make_world(mates_coords=[])
+    return shooter.gun.projectile.radius
+
+
+def test_clear_shot_without_teammates_on_line():
+    world, shooter = make_world(mates_coords=[(500, 450), (100, 100)])
+    assert world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+
+
+def test_teammate_on_line_blocks_shot():
+    world, shooter = make_world(mates_coords=[(500, 310)])
+    assert not world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+
+
+def test_teammate_behind_target_does_not_block_shot():
+    world, shooter = make_world(mates_coords=[(900, 300)])
+    assert world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+
+
+def test_teammate_behind_shooter_does_not_block_shot():
+    world, shooter = make_world(mates_coords=[(150, 300)])
+    assert world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+
+
+def test_dead_teammate_does_not_block_shot():
+    world, shooter = make_world(mates_coords=[], dead_coords=[(500, 300)])
+    assert world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+
+
+def test_projectile_radius_widens_line_of_fire():
+    world, shooter = make_world(mates_coords=[(500, 300 + DRONE_RADIUS + shooter_projectile_radius() - 1)])
+    assert not world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
+    world, shooter = make_world(mates_coords=[(500, 300 + DRONE_RADIUS + shooter_projectile_radius() + 1)])
+    assert world.command_center.fire_control.is_clear_shot(drone=shooter, target=Point(700, 300))
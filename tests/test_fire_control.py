@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# запуск из каталога, в котором лежит hangar_2021: python -m pytest hangar_2021/tests
+
+import numpy as np
+import pytest
+
+from hangar_2021.dontsov_a_v_package import solve_intercept, segment_hits_circles
+
+PROJECTILE_SPEED = 5
+
+
+def get_intercept(shooter, target, velocity, projectile_speed=PROJECTILE_SPEED):
+    return solve_intercept(
+        shooters=np.array([shooter], dtype=float),
+        targets=np.array([target], dtype=float),
+        velocities=np.array([velocity], dtype=float),
+        projectile_speed=projectile_speed,
+    )[0, 0]
+
+
+def test_intercept_standing_target():
+    assert get_intercept(shooter=(0, 0), target=(30, 40), velocity=(0, 0)) == pytest.approx(10)
+
+
+def test_intercept_target_moving_away():
+    assert get_intercept(shooter=(0, 0), target=(100, 0), velocity=(3, 0)) == pytest.approx(50)
+
+
+def test_intercept_target_moving_towards():
+    assert get_intercept(shooter=(0, 0), target=(100, 0), velocity=(-5, 0)) == pytest.approx(10)
+
+
+def test_intercept_target_as_fast_as_projectile():
+    assert get_intercept(shooter=(0, 0), target=(100, 0), velocity=(-5, 0), projectile_speed=5) == pytest.approx(10)
+
+
+def test_intercept_meets_target():
+    shooter, target, velocity = np.array([10., 20.]), np.array([200., -50.]), np.array([2., 3.5])
+    time = get_intercept(shooter=shooter, target=target, velocity=velocity)
+    assert time > 0
+    assert np.linalg.norm(target + velocity * time - shooter) == pytest.approx(PROJECTILE_SPEED * time)
+
+
+def test_no_intercept_when_target_outruns_projectile():
+    assert get_intercept(shooter=(0, 0), target=(100, 0), velocity=(10, 0)) == 0
+
+
+def test_no_intercept_with_negative_discriminant():
+    # цель быстрее снаряда и проходит мимо стрелка: -b / 2a положителен, но встречи нет
+    assert get_intercept(shooter=(0, 0), target=(100, 0), velocity=(-6, 8)) == 0
+
+
+def test_intercept_table_shape():
+    shooters = np.array([(0, 0), (50, 50), (100, 0)], dtype=float)
+    targets = np.array([(200, 200), (300, 0)], dtype=float)
+    velocities = np.array([(1, 0), (0, -1)], dtype=float)
+    times = solve_intercept(shooters=shooters, targets=targets, velocities=velocities, projectile_speed=PROJECTILE_SPEED)
+    assert times.shape == (3, 2)
+    for shooter_number, shooter in enumerate(shooters):
+        for target_number, target in enumerate(targets):
+            assert times[shooter_number, target_number] == pytest.approx(
+                get_intercept(shooter=shooter, target=target, velocity=velocities[target_number]))
+
+
+def get_hits(start, end, centers, radii):
+    return segment_hits_circles(
+        start=np.array(start, dtype=float),
+        end=np.array(end, dtype=float),
+        centers=np.array(centers, dtype=float).reshape(-1, 2),
+        radii=np.array(radii, dtype=float),
+    ).tolist()
+
+
+def test_segment_hits_circle_on_line():
+    assert get_hits(start=(0, 0), end=(100, 0), centers=[(50, 5)], radii=[10]) == [True]
+
+
+def test_segment_misses_circle_aside():
+    assert get_hits(start=(0, 0), end=(100, 0), centers=[(50, 20)], radii=[10]) == [False]
+
+
+def test_segment_touches_circle():
+    assert get_hits(start=(0, 0), end=(100, 0), centers=[(50, 10)], radii=[10]) == [True]
+
+
+def test_segment_misses_circle_behind_ends():
+    hits = get_hits(start=(0, 0), end=(100, 0), centers=[(-20, 0), (120, 0), (105, 0)], radii=[10, 10, 10])
+    assert hits == [False, False, True]
+
+
+def test_zero_length_segment():
+    assert get_hits(start=(10, 10), end=(10, 10), centers=[(15, 10), (40, 10)], radii=[10, 10]) == [True, False]
+
+
+def test_segment_without_circles():
+    assert get_hits(start=(0, 0), end=(100, 0), centers=[], radii=[]) == []
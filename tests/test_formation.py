@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+import pytest
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package import Formation
+from hangar_2021.dontsov_a_v_package.stand_in import StandInWorld, TEAM_NAME
+
+DISTANCE = 150
+
+
+def make_world(drones_count):
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME)
+    world.add_mothership(team='EnemyDrone')
+    world.add_asteroid(coord=Point(600, 300), payload=100)
+    for number in range(drones_count):
+        world.add_drone(team=TEAM_NAME, coord=Point(200 + 20 * number, 200))
+    world.start()
+    return world
+
+
+def get_direction(center, point):
+    return math.degrees(math.atan2(point.y - center.y, point.x - center.x)) % 360
+
+
+def test_spread_order_starts_from_middle():
+    assert Formation.get_spread_order(1) == [0]
+    assert Formation.get_spread_order(5) == [2, 0, 4, 1, 3]
+    assert sorted(Formation.get_spread_order(8)) == list(range(8))
+
+
+def test_single_drone_faces_field_center():
+    world = make_world(drones_count=1)
+    nav = world.command_center
+    home = nav.my_mothership
+    point = nav.formation.reserve(drone=world.team_drones[0], mothership=home, distance=DISTANCE)
+    assert home.coord.distance_to(point) == pytest.approx(DISTANCE)
+    assert get_direction(home.coord, point) == pytest.approx(get_direction(home.coord, nav.point_center_field))
+
+
+def test_slots_span_the_arc():
+    world = make_world(drones_count=5)
+    nav = world.command_center
+    home = nav.my_mothership
+    slots = nav.formation.get_slots(mothership=home, distance=DISTANCE, angle=60)
+    assert len(slots) == 5
+    to_center = get_direction(home.coord, nav.point_center_field)
+    offsets = [(get_direction(home.coord, Point(*slot)) - to_center + 180) % 360 - 180 for slot in slots]
+    assert offsets == pytest.approx([0, -60, 60, -30, 30])
+
+
+def test_drones_get_distinct_slots():
+    world = make_world(drones_count=4)
+    nav = world.command_center
+    points = []
+    for drone in world.team_drones:
+        drone.start_position = nav.formation.reserve(drone=drone, mothership=nav.my_mothership, distance=DISTANCE)
+        points.append((drone.start_position.x, drone.start_position.y))
+    assert len(set(points)) == 4
+
+
+def test_deaths_keep_slot_table_and_survivors_take_first_slots():
+    world = make_world(drones_count=4)
+    nav = world.command_center
+    drones = world.team_drones
+    for drone in drones:
+        drone.start_position = nav.formation.reserve(drone=drone, mothership=nav.my_mothership, distance=DISTANCE)
+    slots = nav.formation.get_slots(mothership=nav.my_mothership, distance=DISTANCE, angle=60)
+    drones[0].health = 0
+    drones[1].health = 0
+    world.step()
+    assert nav.formation.get_slots(mothership=nav.my_mothership, distance=DISTANCE, angle=60) is slots
+    for drone in drones[2:]:
+        drone.start_position = nav.formation.reserve(drone=drone, mothership=nav.my_mothership, distance=DISTANCE)
+    assert {(drone.start_position.x, drone.start_position.y) for drone in drones[2:]} == set(slots[:2])
+
+
+def test_slot_of_dead_drone_is_handed_out_again():
+    world = make_world(drones_count=2)
+    nav = world.command_center
+    first, second = world.team_drones
+    first.start_position = nav.formation.reserve(drone=first, mothership=nav.my_mothership, distance=DISTANCE)
+    first.health = 0
+    point = nav.formation.reserve(drone=second, mothership=nav.my_mothership, distance=DISTANCE)
+    assert (point.x, point.y) == (first.start_position.x, first.start_position.y)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package import KinematicTracker
+from hangar_2021.dontsov_a_v_package.stand_in import StandInDrone
+
+SPEED = 2.
+
+
+def make_drone(x, y, is_moving=True, direction=0):
+    return StandInDrone(scene=None, mothership=None, coord=Point(x, y), team='EnemyDrone',
+                        is_moving=is_moving, direction=direction)
+
+
+def make_tracker(**kwargs):
+    kwargs.setdefault('speed', SPEED)
+    return KinematicTracker(**kwargs)
+
+
+def test_standing_drone_has_zero_velocity():
+    tracker = make_tracker()
+    drone = make_drone(100, 100, is_moving=False)
+    tracker.update(tick=1, drones=[drone])
+    assert tracker.get_velocities([drone]).tolist() == [[0, 0]]
+
+
+def test_first_sample_uses_heading():
+    tracker = make_tracker()
+    drone = make_drone(100, 100, direction=90)
+    tracker.update(tick=1, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([0, SPEED], abs=1e-9)
+
+
+def test_velocity_from_consecutive_ticks():
+    tracker = make_tracker()
+    drone = make_drone(100, 100)
+    tracker.update(tick=1, drones=[drone])
+    drone.coord = Point(103, 96)
+    tracker.update(tick=2, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([3, -4])
+
+
+def test_velocity_from_heartbeat_samples():
+    tracker = make_tracker()
+    drone = make_drone(100, 100)
+    for tick in (5, 10, 15):
+        drone.coord = Point(100 + 2 * tick, 100 + tick)
+        tracker.update(tick=tick, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([2, 1])
+
+
+def test_stale_sample_falls_back_to_heading():
+    tracker = make_tracker(max_gap=5)
+    drone = make_drone(100, 100, direction=180)
+    tracker.update(tick=1, drones=[drone])
+    drone.coord = Point(130, 100)
+    tracker.update(tick=11, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([-SPEED, 0], abs=1e-9)
+
+
+def test_drone_that_just_started_uses_heading():
+    tracker = make_tracker()
+    drone = make_drone(100, 100, direction=0)
+    tracker.update(tick=1, drones=[drone])
+    tracker.update(tick=2, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([SPEED, 0])
+
+
+def test_same_tick_is_recorded_once():
+    tracker = make_tracker()
+    drone = make_drone(100, 100)
+    tracker.update(tick=1, drones=[drone])
+    drone.coord = Point(110, 100)
+    tracker.update(tick=2, drones=[drone])
+    drone.coord = Point(500, 500)
+    tracker.update(tick=2, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([10, 0])
+
+
+def test_ring_buffer_keeps_latest_samples():
+    tracker = make_tracker(length=3)
+    drone = make_drone(0, 0)
+    for tick in range(1, 10):
+        drone.coord = Point(tick * tick, 0)
+        tracker.update(tick=tick, drones=[drone])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([81 - 64, 0])
+
+
+def test_drones_get_separate_rows():
+    tracker = make_tracker(capacity=2)
+    drones = [make_drone(100 * number, 0) for number in range(5)]
+    tracker.update(tick=1, drones=drones)
+    for number, drone in enumerate(drones):
+        drone.coord = Point(100 * number + number, number)
+    tracker.update(tick=2, drones=drones)
+    assert len(tracker) == 5
+    expected = [[number, number] for number in range(1, 5)]
+    assert tracker.get_velocities(drones[1:]) == pytest.approx(np.array(expected, dtype=float))
+
+
+def test_untracked_drone_uses_heading():
+    tracker = make_tracker()
+    tracked, untracked = make_drone(0, 0), make_drone(50, 50, direction=270)
+    tracker.update(tick=1, drones=[tracked])
+    assert untracked not in tracker
+    assert tracker.get_velocities([untracked])[0] == pytest.approx([0, -SPEED], abs=1e-9)
+
+
+def test_drone_returning_after_gap_uses_heading():
+    tracker = make_tracker(max_gap=5)
+    drone, other = make_drone(0, 0, direction=90), make_drone(500, 500)
+    tracker.update(tick=1, drones=[drone, other])
+    for tick in range(2, 20):
+        tracker.update(tick=tick, drones=[other])
+    drone.coord = Point(300, 300)
+    tracker.update(tick=20, drones=[drone, other])
+    assert tracker.get_velocities([drone])[0] == pytest.approx([0, SPEED], abs=1e-9)
+
+
+def test_headings_follow_measured_motion():
+    tracker = make_tracker()
+    moving, standing = make_drone(100, 100, direction=0), make_drone(300, 300, is_moving=False, direction=45)
+    tracker.update(tick=1, drones=[moving, standing])
+    moving.coord = Point(100, 103)
+    tracker.update(tick=2, drones=[moving, standing])
+    assert tracker.get_headings([moving, standing]) == pytest.approx([90, 45])
+
+
+def test_untracked_drone_heading_is_body_direction():
+    tracker = make_tracker()
+    assert tracker.get_headings([make_drone(0, 0, direction=300)]) == pytest.approx([300])
+
+
+def test_predict_scalar_horizon():
+    tracker = make_tracker()
+    drone, standing = make_drone(100, 100), make_drone(500, 500, is_moving=False)
+    tracker.update(tick=1, drones=[drone, standing])
+    drone.coord = Point(103, 96)
+    tracker.update(tick=2, drones=[drone, standing])
+    assert tracker.predict([drone, standing], ticks_ahead=10) == pytest.approx(np.array([[133, 56], [500, 500]]))
+
+
+def test_predict_shared_and_per_drone_horizons():
+    tracker = make_tracker()
+    drones = [make_drone(0, 0), make_drone(100, 0)]
+    tracker.update(tick=1, drones=drones)
+    drones[0].coord, drones[1].coord = Point(1, 0), Point(100, 2)
+    tracker.update(tick=2, drones=drones)
+    shared = tracker.predict(drones, ticks_ahead=[0, 5])
+    assert shared.shape == (2, 2, 2)
+    assert shared == pytest.approx(np.array([[[1, 0], [6, 0]], [[100, 2], [100, 12]]], dtype=float))
+    own = tracker.predict(drones, ticks_ahead=np.array([[1], [3]]))
+    assert own == pytest.approx(np.array([[[2, 0]], [[100, 8]]], dtype=float))
+
+
+def test_predict_from_older_sample_adds_elapsed_ticks():
+    tracker = make_tracker()
+    drone, other = make_drone(0, 0), make_drone(500, 500)
+    tracker.update(tick=1, drones=[drone, other])
+    drone.coord = Point(2, 0)
+    tracker.update(tick=2, drones=[drone, other])
+    tracker.update(tick=4, drones=[other])
+    assert tracker.predict([drone], ticks_ahead=1)[0] == pytest.approx([8, 0])
+
+
+def test_predict_untracked_drone_from_its_coord():
+    tracker = make_tracker()
+    drone = make_drone(10, 20, direction=90)
+    assert tracker.predict([drone], ticks_ahead=5)[0] == pytest.approx([10, 20 + 5 * SPEED])
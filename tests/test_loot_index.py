@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package.stand_in import StandInWorld, TEAM_NAME
+
+ENEMY_TEAM = 'EnemyDrone'
+
+
+def make_world():
+    """
+    Сцена с двумя базами, тремя астероидами, живым и погибшим вражескими дронами.
+    """
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME)
+    world.add_mothership(team=ENEMY_TEAM, payload=300)
+    world.add_asteroid(coord=Point(900, 100), payload=100)
+    world.add_asteroid(coord=Point(200, 500), payload=100)
+    world.add_asteroid(coord=Point(300, 100), payload=0)
+    world.add_drone(team=TEAM_NAME, coord=Point(200, 200), payload=50)
+    world.add_drone(team=ENEMY_TEAM, coord=Point(1000, 500), payload=50)
+    world.add_drone(team=ENEMY_TEAM, coord=Point(700, 200), payload=40).health = 0
+    world.start()
+    return world
+
+
+def get_sector(world, obj):
+    return world.command_center.sector_geometry.get_index(obj)
+
+
+def test_index_holds_only_loot():
+    world = make_world()
+    full, other, empty = world.space_field.asteroids
+    dead = world.space_field.teams[ENEMY_TEAM][1]
+    index = world.command_center.loot_index
+    assert index.objects_with_loot == (full, other, dead)
+    assert empty not in index
+    assert all(not drone.is_alive for drone in index.objects_with_loot[2:])
+
+
+def test_loot_is_bucketed_by_sector():
+    world = make_world()
+    index = world.command_center.loot_index
+    for sector_index, bucket in enumerate(index.loot_by_sector):
+        assert all(get_sector(world, obj) == sector_index for obj in bucket)
+        assert index.has_loot(sector_index) == bool(bucket)
+    assert sum(len(bucket) for bucket in index.loot_by_sector) == len(index)
+
+
+def test_emptied_asteroid_is_removed_on_next_tick():
+    world = make_world()
+    index = world.command_center.loot_index
+    asteroid = world.space_field.asteroids[0]
+    sector_index = get_sector(world, asteroid)
+    assert asteroid in index.loot_by_sector[sector_index]
+    version = index.version
+    asteroid.payload = 0
+    world.step()
+    assert asteroid not in index
+    assert asteroid not in index.loot_by_sector[sector_index]
+    assert index.version > version
+
+
+def test_update_rechecks_object_at_once():
+    world = make_world()
+    index = world.command_center.loot_index
+    asteroid = world.space_field.asteroids[1]
+    index.objects_with_loot
+    asteroid.payload = 0
+    assert not index.update(asteroid)
+    assert asteroid not in index.objects_with_loot
+
+
+def test_killed_drone_and_base_become_loot():
+    world = make_world()
+    index = world.command_center.loot_index
+    enemy = world.space_field.teams[ENEMY_TEAM][0]
+    enemy_base = world.space_field.motherships[1]
+    assert enemy not in index and enemy_base not in index
+    enemy.health = 0
+    enemy_base.health = 0
+    world.step()
+    assert enemy in index and enemy_base in index
+    assert index.objects_with_loot.index(enemy) < index.objects_with_loot.index(enemy_base)
+
+
+def test_own_dead_base_is_not_loot():
+    world = make_world()
+    index = world.command_center.loot_index
+    own_base = world.space_field.motherships[0]
+    own_base.payload = 100
+    own_base.health = 0
+    world.step()
+    assert own_base not in index
+
+
+def test_drifting_dead_drone_changes_sector():
+    world = make_world()
+    index = world.command_center.loot_index
+    dead = world.space_field.teams[ENEMY_TEAM][1]
+    old_sector = get_sector(world, dead)
+    dead.coord = Point(1100, 550)
+    new_sector = get_sector(world, dead)
+    assert new_sector != old_sector
+    world.step()
+    assert dead in index.loot_by_sector[new_sector]
+    assert dead not in index.loot_by_sector[old_sector]
+
+
+def test_new_asteroid_rebuilds_index():
+    world = make_world()
+    index = world.command_center.loot_index
+    index.objects_with_loot
+    asteroid = world.add_asteroid(coord=Point(1100, 100), payload=10)
+    world.step()
+    assert asteroid in index
+    assert index.objects_with_loot.index(asteroid) < len(world.space_field.asteroids)
+
+
+def test_unchanged_tick_keeps_version():
+    world = make_world()
+    index = world.command_center.loot_index
+    index.objects_with_loot
+    version = index.version
+    world.step()
+    index.objects_with_loot
+    assert index.version == version
+
+
+def test_returned_loot_cannot_change_index():
+    world = make_world()
+    nav = world.command_center
+    objects = nav.get_objects_with_loot()
+    objects.clear()
+    assert nav.loot_index.objects_with_loot
+    sector = nav.sectors[0]
+    nav.get_objects_with_loot(sector=sector).append(world.space_field.motherships[0])
+    assert world.space_field.motherships[0] not in nav.loot_index.loot_by_sector[sector.index]
+    assert isinstance(nav.loot_index.loot_by_sector[sector.index], tuple)
+
+
+def test_load_complete_rechecks_source_at_once():
+    world = make_world()
+    nav = world.command_center
+    drone = world.team_drones[0]
+    asteroid = world.space_field.asteroids[0]
+    assert asteroid in nav.loot_index
+    asteroid.payload = 0
+    drone.target_move = asteroid
+    nav.on_load_complete(drone=drone)
+    assert asteroid not in nav.loot_index.objects_with_loot
+
+
+def test_death_handler_adds_loot_on_same_tick():
+    world = make_world()
+    nav = world.command_center
+    enemy = world.space_field.teams[ENEMY_TEAM][0]
+    nav.loot_index.objects_with_loot
+    enemy.health = 0
+    nav.on_death(enemy)
+    assert enemy in nav.loot_index.objects_with_loot
+
+
+def test_nearest_loot_to_point():
+    world = make_world()
+    index = world.command_center.loot_index
+    full, other, _ = world.space_field.asteroids
+    dead = world.space_field.teams[ENEMY_TEAM][1]
+    assert index.get_nearest(Point(880, 120)) is full
+    assert index.get_nearest(Point(650, 250)) is dead
+    assert index.get_nearest(Point(100, 590)) is other
+
+
+def test_nearest_loot_crosses_sector_border():
+    world = make_world()
+    index = world.command_center.loot_index
+    dead = world.space_field.teams[ENEMY_TEAM][1]
+    point = Point(590, 200)
+    assert get_sector(world, point) != get_sector(world, dead)
+    assert index.get_nearest(point) is dead
+
+
+def test_nearest_loot_in_sector():
+    world = make_world()
+    index = world.command_center.loot_index
+    full = world.space_field.asteroids[0]
+    sector_index = get_sector(world, full)
+    assert index.get_nearest(Point(100, 100), sector_index=sector_index) in index.loot_by_sector[sector_index]
+    assert index.get_nearest(Point(100, 100), sector_index=get_sector(world, Point(100, 100))) is None
+
+
+def test_nearest_skips_emptied_loot():
+    world = make_world()
+    index = world.command_center.loot_index
+    full, other, _ = world.space_field.asteroids
+    full.payload = 0
+    world.step()
+    assert index.get_nearest(Point(900, 100)) is not full
+
+
+def test_no_nearest_without_loot():
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME)
+    world.add_asteroid(coord=Point(300, 300), payload=0)
+    world.add_drone(team=TEAM_NAME, coord=Point(200, 200))
+    world.start()
+    assert world.command_center.loot_index.get_nearest(Point(0, 0)) is None
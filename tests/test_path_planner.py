@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package import PathPlanner, ThreatRaster, segment_hits_circles
+from hangar_2021.dontsov_a_v_package.path_planner import PATH_CELL_SIZE, THREAT_COST
+from hangar_2021.dontsov_a_v_package.stand_in import StandInWorld, TEAM_NAME
+
+ENEMY_TEAM = 'EnemyDrone'
+WALL_COST = 1. + THREAT_COST
+
+
+def make_planner(size=10):
+    return PathPlanner(command_center=None, width=size * PATH_CELL_SIZE, height=size * PATH_CELL_SIZE)
+
+
+def is_connected(path):
+    return all(
+        max(abs(cell[0] - previous[0]), abs(cell[1] - previous[1])) == 1
+        for previous, cell in zip(path, path[1:])
+    )
+
+
+def test_path_on_free_grid():
+    planner = make_planner()
+    path = planner.find_path(start=(0, 0), goal=(6, 9))
+    assert path[0] == (0, 0) and path[-1] == (6, 9)
+    assert is_connected(path)
+    assert len(path) == 10
+
+
+def test_path_to_itself():
+    planner = make_planner()
+    assert planner.find_path(start=(3, 3), goal=(3, 3)) == [(3, 3)]
+
+
+def test_path_goes_through_gap_in_wall():
+    planner = make_planner()
+    planner.costs[:, 5] = WALL_COST
+    planner.costs[8, 5] = 1.
+    path = planner.find_path(start=(2, 0), goal=(2, 9))
+    assert path[0] == (2, 0) and path[-1] == (2, 9)
+    assert is_connected(path)
+    assert (8, 5) in path
+    assert all(planner.costs[cell] == 1. for cell in path)
+
+
+def test_path_crosses_wall_without_gap():
+    planner = make_planner()
+    planner.costs[:, 5] = WALL_COST
+    path = planner.find_path(start=(2, 0), goal=(2, 9))
+    assert is_connected(path)
+    assert sum(planner.costs[cell] == WALL_COST for cell in path) == 1
+
+
+def test_straight_waypoints_on_free_grid():
+    planner = make_planner()
+    assert planner.get_waypoints(start=(0, 0), goal=(6, 9)) == [(6, 9)]
+
+
+def test_waypoints_avoid_obstacle():
+    planner = make_planner()
+    planner.costs[0:7, 4:6] = WALL_COST
+    waypoints = planner.get_waypoints(start=(2, 0), goal=(2, 9))
+    assert waypoints[-1] == (2, 9)
+    assert len(waypoints) > 1
+    route = [(2, 0)] + waypoints
+    for start, goal in zip(route, route[1:]):
+        assert planner.get_line_cost(start, goal) == 1. or max(abs(np.subtract(start, goal))) == 1
+
+
+def test_waypoints_are_cached():
+    planner = make_planner()
+    planner.costs[0:7, 4:6] = WALL_COST
+    waypoints = planner.get_waypoints(start=(2, 0), goal=(2, 9))
+    assert planner.get_waypoints(start=(2, 0), goal=(2, 9)) is waypoints
+
+
+def test_cell_of_point_outside_field():
+    planner = make_planner()
+    assert planner.get_cell(Point(-10, 1000)) == (9, 0)
+
+
+def make_world(radius):
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME)
+    world.add_mothership(team=ENEMY_TEAM)
+    world.add_asteroid(coord=Point(600, 100), payload=100)
+    drone = world.add_drone(team=TEAM_NAME, coord=Point(100, 300))
+    enemy = world.add_drone(team=ENEMY_TEAM, coord=Point(600, 300))
+    world.start()
+    world.command_center.threat_raster = ThreatRaster(radius=radius)
+    return world, drone, enemy
+
+
+def test_waypoint_detours_around_standing_enemy():
+    radius = 100
+    world, drone, enemy = make_world(radius=radius)
+    planner = world.command_center.path_planner
+    target = Point(1100, 300)
+    waypoint = planner.get_waypoint(drone=drone, target=target)
+    assert waypoint is not target
+
+    route = [drone.coord] + [planner.get_center(cell) for cell in planner.get_waypoints(
+        start=planner.get_cell(drone), goal=planner.get_cell(target))]
+    for start, end in zip(route, route[1:]):
+        assert not segment_hits_circles(
+            start=np.array([start.x, start.y]),
+            end=np.array([end.x, end.y]),
+            centers=np.array([[enemy.coord.x, enemy.coord.y]]),
+            radii=np.array([radius - PATH_CELL_SIZE]),
+        ).any()
+
+
+def test_waypoint_is_target_without_threats():
+    world, drone, enemy = make_world(radius=100)
+    enemy.health = 0
+    target = Point(1100, 300)
+    assert world.command_center.path_planner.get_waypoint(drone=drone, target=target) is target
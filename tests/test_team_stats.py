@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+from robogame_engine.geometry import Point
+
+from hangar_2021.dontsov_a_v_package.stand_in import StandInWorld, TEAM_NAME
+
+ENEMY_TEAM = 'EnemyDrone'
+
+
+def make_world():
+    """
+    Сцена с двумя дронами команды и тремя вражескими дронами, двое из которых у своей базы.
+    """
+    world = StandInWorld()
+    world.add_mothership(team=TEAM_NAME, payload=100)
+    enemy_base = world.add_mothership(team=ENEMY_TEAM, payload=200)
+    world.add_asteroid(coord=Point(600, 300), payload=100)
+    world.add_drone(team=TEAM_NAME, coord=Point(300, 300), payload=30)
+    world.add_drone(team=TEAM_NAME, coord=Point(350, 300))
+    world.add_drone(team=ENEMY_TEAM, coord=Point(enemy_base.x + 50, enemy_base.y), payload=20)
+    world.add_drone(team=ENEMY_TEAM, coord=Point(enemy_base.x, enemy_base.y + 80))
+    world.add_drone(team=ENEMY_TEAM, coord=Point(600, 100), payload=10)
+    world.start()
+    world.command_center.snapshot
+    return world
+
+
+def get_team(world, team_name):
+    return world.command_center.get_team_data(team_name=team_name)
+
+
+def test_teams_are_registered_on_start():
+    world = make_world()
+    team, enemy = get_team(world, TEAM_NAME), get_team(world, ENEMY_TEAM)
+    assert (team.number_soldiers, team.elirium, team.defenders) == (2, 130, 0)
+    assert (enemy.number_soldiers, enemy.elirium, enemy.defenders) == (3, 230, 2)
+
+
+def test_unload_callback_moves_cargo_to_base():
+    world = make_world()
+    drone = world.team_drones[0]
+    drone.payload = 0
+    drone.my_mothership.payload += 30
+    world.command_center.on_unload_complete(drone=drone)
+    assert get_team(world, TEAM_NAME).elirium == 130
+
+
+def test_load_callback_adds_cargo():
+    world = make_world()
+    drone = world.team_drones[1]
+    drone.payload = 40
+    world.command_center.on_load_complete(drone=drone)
+    assert get_team(world, TEAM_NAME).elirium == 170
+
+
+def test_enemy_cargo_is_refreshed_on_heartbeat():
+    world = make_world()
+    world.space_field.teams[ENEMY_TEAM][2].payload = 60
+    world.step()
+    assert get_team(world, ENEMY_TEAM).elirium == 230
+    world.command_center.on_heartbeat()
+    assert get_team(world, ENEMY_TEAM).elirium == 280
+
+
+def test_death_is_counted_on_next_tick():
+    world = make_world()
+    world.space_field.teams[ENEMY_TEAM][0].health = 0
+    world.step()
+    enemy = get_team(world, ENEMY_TEAM)
+    assert (enemy.number_soldiers, enemy.elirium, enemy.defenders) == (2, 210, 1)
+
+
+def test_dead_base_leaves_team_elirium():
+    world = make_world()
+    world.space_field.motherships[1].health = 0
+    world.step()
+    assert get_team(world, ENEMY_TEAM).elirium == 30
+
+
+def test_defenders_follow_positions():
+    world = make_world()
+    enemy_base = world.space_field.motherships[1]
+    world.space_field.teams[ENEMY_TEAM][2].coord = Point(enemy_base.x - 60, enemy_base.y - 60)
+    world.step()
+    assert get_team(world, ENEMY_TEAM).defenders == 3